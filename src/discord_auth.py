@@ -7,6 +7,7 @@ Handles the OAuth flow, credential storage, and session management.
 import http.server
 import json
 import secrets
+import socket
 import socketserver
 import threading
 import urllib.parse
@@ -136,6 +137,7 @@ class DiscordAuth:
         self._callback_server = None
         self._server_thread = None
         self._expected_state: Optional[str] = None
+        self._login_cancelled = threading.Event()
 
     def get_api_url(self) -> str:
         """Get the sync API base URL."""
@@ -192,6 +194,8 @@ class DiscordAuth:
             dict with 'success' and 'message' or 'error'
         """
         try:
+            self._login_cancelled.clear()
+
             # Generate state for CSRF protection
             self._expected_state = secrets.token_urlsafe(32)
 
@@ -235,6 +239,17 @@ class DiscordAuth:
         finally:
             self._stop_callback_server()
 
+    def cancel_login(self) -> None:
+        """Abort a login flow that is waiting for the browser callback (any thread)."""
+        self._login_cancelled.set()
+
+        # handle_request() blocks in select(); a throwaway connection wakes it
+        if self._callback_server:
+            try:
+                socket.create_connection(('127.0.0.1', CALLBACK_PORT), timeout=1).close()
+            except OSError as e:
+                logger.debug(f"Could not wake callback server: {e}")
+
     def logout(self) -> None:
         """Clear stored credentials and invalidate session on server."""
         token = self.get_session_token()
@@ -326,9 +341,15 @@ class DiscordAuth:
         if not self._callback_server:
             return {'success': False, 'error': 'Callback server not running'}
 
+        if self._login_cancelled.is_set():
+            return {'success': False, 'error': 'Login cancelled'}
+
         # Handle one request (blocking)
         self._callback_server.handle_request()
 
+        if self._login_cancelled.is_set():
+            return {'success': False, 'error': 'Login cancelled'}
+
         # Check for errors
         if OAuthCallbackHandler.error:
             return {'success': False, 'error': f'Discord error: {OAuthCallbackHandler.error}'}
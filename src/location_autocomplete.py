@@ -6,7 +6,64 @@ Loads Star Citizen location data and provides filtered suggestions.
 
 import json
 import os
-from typing import List, Dict, Any
+from functools import cached_property
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PyQt6.QtCore import QStringListModel
+
+
+class _TrieNode:
+    """Node of a LocationTrie."""
+
+    __slots__ = ("children", "matches")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.matches: List[int] = []  # Sorted indices of names containing this path
+
+
+class LocationTrie:
+    """
+    Suffix trie over location names for case-insensitive substring lookup.
+
+    Every suffix of every name is indexed, so descending by a query reaches
+    the node whose match list holds all names containing that query. Lookup
+    cost depends on the query length, not on the number of names.
+    """
+
+    def __init__(self, names: List[str]) -> None:
+        self.names = list(names)
+        self.root = _TrieNode()
+        self.root.matches = list(range(len(self.names)))
+
+        for idx, name in enumerate(self.names):
+            lowered = name.lower()
+            for start in range(len(lowered)):
+                node = self.root
+                for ch in lowered[start:]:
+                    child = node.children.get(ch)
+                    if child is None:
+                        child = node.children[ch] = _TrieNode()
+                    node = child
+                    # Names are inserted in order, so a duplicate can only be the last entry
+                    if not node.matches or node.matches[-1] != idx:
+                        node.matches.append(idx)
+
+    def descend(self, node: _TrieNode, text: str) -> Optional[_TrieNode]:
+        """Walk down from node along lowercase text, or None if no name contains it."""
+        for ch in text:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def names_for(self, node: Optional[_TrieNode]) -> List[str]:
+        """Get the names indexed under node, in their original order."""
+        if node is None:
+            return []
+        names = self.names
+        return [names[i] for i in node.matches]
 
 
 class LocationMatcher:
@@ -16,6 +73,7 @@ class LocationMatcher:
         self.data_dir = data_dir
         self.all_locations: List[str] = []
         self.scannable_locations: List[str] = []  # Planets and stations only
+        self._scannable_snapshot: Tuple[str, ...] = ()
         self.location_aliases: Dict[str, str] = {}  # alias -> canonical name
         self.load_locations()
         self._build_aliases()
@@ -43,6 +101,11 @@ class LocationMatcher:
         # Remove duplicates and sort
         self.all_locations = sorted(set(self.all_locations))
         self.scannable_locations = sorted(set(self.scannable_locations))
+        self._scannable_snapshot = tuple(self.scannable_locations)
+
+        # Keep an already shared completion model in step with a reload
+        if "completion_model" in self.__dict__:
+            self.completion_model.setStringList(self.all_locations)
 
     def _extract_locations_from_file(self, filepath: str) -> None:
         """Extract all location names from a JSON file."""
@@ -147,9 +210,21 @@ class LocationMatcher:
         """Get complete list of all locations."""
         return self.all_locations.copy()
 
-    def get_scannable_locations(self) -> List[str]:
-        """Get list of locations where missions can be scanned (planets/stations)."""
-        return self.scannable_locations.copy()
+    @cached_property
+    def completion_model(self) -> "QStringListModel":
+        """Qt list model of all locations, shared by every location completer."""
+        from PyQt6.QtCore import QStringListModel
+
+        return QStringListModel(self.all_locations)
+
+    def get_scannable_locations(self) -> Tuple[str, ...]:
+        """
+        Get locations where missions can be scanned (planets/stations).
+
+        The same immutable snapshot is returned until the next load_locations(),
+        so callers can share it without copying.
+        """
+        return self._scannable_snapshot
 
     def get_locations_by_prefix(self, prefix: str, limit: int = 10) -> List[str]:
         """
@@ -33,6 +33,8 @@ class MissionManager:
         self.lock_file = storage_file + ".lock"
         self.max_backups = max_backups
         self.missions: List[Dict[str, Any]] = []
+        # Incremented whenever missions change, so callers can cache derived data
+        self.revision: int = 0
         self.load()
 
     def add_mission(self, mission_data: Dict[str, Any]) -> str:
@@ -280,6 +282,9 @@ class MissionManager:
 
     def save(self) -> None:
         """Save missions to disk with validation and file locking."""
+        # Every mutation goes through save(), so bump the revision here
+        self.revision += 1
+
         lock = FileLock(self.lock_file, timeout=10)
 
         try:
@@ -308,6 +313,8 @@ class MissionManager:
 
     def load(self) -> None:
         """Load missions from disk with validation and migration."""
+        self.revision += 1
+
         if not os.path.exists(self.storage_file):
             self.missions = []
             logger.info(f"No existing missions file found, starting fresh")
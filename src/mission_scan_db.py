@@ -86,6 +86,10 @@ class MissionScanDB:
         self.storage_file = storage_file
         self.lock_file = storage_file + ".lock"
         self.scans: List[Dict[str, Any]] = []
+        # Incremented by save() and load(), so callers can cache derived data.
+        # Code that edits self.scans directly (e.g. the scan database tab's
+        # sync import) is only seen once it calls save()
+        self.revision: int = 0
         self._location_hierarchy = LocationHierarchy()
         self.load()
 
@@ -720,6 +724,10 @@ class MissionScanDB:
 
     def save(self) -> None:
         """Save scans to disk with file locking."""
+        # The mutating methods here all end in save(), and direct edits to
+        # self.scans are expected to call it too, so the revision moves here
+        self.revision += 1
+
         lock = FileLock(self.lock_file, timeout=10)
 
         try:
@@ -740,6 +748,8 @@ class MissionScanDB:
 
     def load(self) -> None:
         """Load scans from disk, migrating if necessary."""
+        self.revision += 1
+
         if not os.path.exists(self.storage_file):
             self.scans = []
             logger.info("No existing scans file found, starting fresh")
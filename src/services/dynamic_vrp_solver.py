@@ -13,7 +13,7 @@ Based on research: "Dynamic Hauling Mission Manager (Star Citizen)"
 import time
 import random
 import math
-from typing import List, Optional, Dict, Tuple, Set
+from typing import Callable, List, Optional, Dict, Tuple, Set
 from dataclasses import dataclass, field
 from collections import defaultdict
 from enum import Enum
@@ -130,7 +130,8 @@ class DynamicVRPSolver:
         self,
         ship_capacity: int,
         starting_location: Optional[str] = None,
-        time_oracle: Optional[TimeOracle] = None
+        time_oracle: Optional[TimeOracle] = None,
+        should_stop: Optional[Callable[[], bool]] = None
     ):
         """
         Initialize dynamic VRP solver.
@@ -139,10 +140,13 @@ class DynamicVRPSolver:
             ship_capacity: Maximum cargo capacity in SCU
             starting_location: Optional starting location
             time_oracle: Optional time oracle (uses global if not provided)
+            should_stop: Optional callable polled between search iterations;
+                once it returns True, optimization ends with the best route so far
         """
         self.ship_capacity = ship_capacity
         self.starting_location = starting_location
         self.time_oracle = time_oracle or get_time_oracle()
+        self.should_stop = should_stop or (lambda: False)
 
         # Cost weights
         self.alpha_wait = 0.1  # Wait time penalty
@@ -332,6 +336,10 @@ class DynamicVRPSolver:
         candidates = []
         n = len(route)
 
+        # Invariant across every candidate position
+        old_cost = self._evaluate_route_cost(route)
+        new_inserted_ids = inserted_ids | {request.request_id}
+
         # Try all valid pickup positions
         for pickup_pos in range(n + 1):
             # Try all valid delivery positions (must be after pickup)
@@ -342,9 +350,8 @@ class DynamicVRPSolver:
                            route[delivery_pos-1:]
 
                 # Check feasibility
-                if self._is_sequence_feasible(new_route, inserted_ids | {request.request_id}):
+                if self._is_sequence_feasible(new_route, new_inserted_ids):
                     # Calculate delta cost
-                    old_cost = self._evaluate_route_cost(route)
                     new_cost = self._evaluate_route_cost(new_route)
                     delta_cost = new_cost - old_cost
 
@@ -451,7 +458,7 @@ class DynamicVRPSolver:
         best_cost = self._evaluate_route_cost(route)
         improved = True
 
-        while improved and (time.time() - start_time) * 1000 < time_budget_ms:
+        while improved and (time.time() - start_time) * 1000 < time_budget_ms and not self.should_stop():
             improved = False
 
             # Try PD-relocate
@@ -496,6 +503,7 @@ class DynamicVRPSolver:
 
         # Build pickup-delivery pairs
         pairs = self._get_pd_pairs(route)
+        pair_ids = {p[0] for p in pairs.values()}
 
         for pair_id, (pickup_idx, delivery_idx) in pairs.items():
             # Remove the pair
@@ -512,7 +520,7 @@ class DynamicVRPSolver:
                                remaining[new_pickup_pos:new_delivery_pos-1] + [delivery_node] + \
                                remaining[new_delivery_pos-1:]
 
-                    if self._is_sequence_feasible(new_route, set(p[0] for p in pairs.values())):
+                    if self._is_sequence_feasible(new_route, pair_ids):
                         new_cost = self._evaluate_route_cost(new_route)
                         if new_cost < best_cost:
                             best_route = new_route
@@ -559,6 +567,7 @@ class DynamicVRPSolver:
         """
         best_route = route
         best_cost = current_cost
+        inserted_ids = {node.request_id for node in route}
 
         for seq_len in [1, 2, 3]:
             for i in range(len(route) - seq_len + 1):
@@ -572,7 +581,6 @@ class DynamicVRPSolver:
 
                     new_route = remaining[:new_pos] + sequence + remaining[new_pos:]
 
-                    inserted_ids = {node.request_id for node in route}
                     if self._is_sequence_feasible(new_route, inserted_ids):
                         new_cost = self._evaluate_route_cost(new_route)
                         if new_cost < best_cost:
@@ -629,7 +637,8 @@ class DynamicVRPSolver:
         iterations = 0
         max_iterations = 50
 
-        while (time.time() - start_time) * 1000 < time_budget_ms and iterations < max_iterations:
+        while ((time.time() - start_time) * 1000 < time_budget_ms and iterations < max_iterations
+               and not self.should_stop()):
             iterations += 1
 
             # Randomly choose destroy percentage
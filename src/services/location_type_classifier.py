@@ -122,6 +122,10 @@ class LocationTypeClassifier:
         self._locations_by_type: Dict[str, List[str]] = {t: [] for t in LocationType.all_types()}
         self._locations_by_system: Dict[str, List[str]] = {}
 
+        # Results by raw location name; scans repeat the same names constantly
+        self._type_cache: Dict[str, str] = {}
+        self._system_cache: Dict[str, Optional[str]] = {}
+
         self._load_all_data()
 
     def _load_all_data(self) -> None:
@@ -227,14 +231,20 @@ class LocationTypeClassifier:
         if not location:
             return LocationType.UNKNOWN
 
+        location_type = self._type_cache.get(location)
+        if location_type is not None:
+            return location_type
+
         normalized = self._normalize_name(location)
 
-        # Direct lookup
+        # Direct lookup, falling back to pattern matching
         if normalized in self._location_map:
-            return self._location_map[normalized].location_type
+            location_type = self._location_map[normalized].location_type
+        else:
+            location_type = self._classify_by_pattern(location)
 
-        # Fallback to pattern matching
-        return self._classify_by_pattern(location)
+        self._type_cache[location] = location_type
+        return location_type
 
     def _classify_by_pattern(self, location: str) -> str:
         """Classify location by name patterns when not found in data."""
@@ -291,14 +301,20 @@ class LocationTypeClassifier:
         if not location:
             return None
 
+        # None is a valid result, so check membership rather than the value
+        if location in self._system_cache:
+            return self._system_cache[location]
+
         normalized = self._normalize_name(location)
 
-        # Direct lookup
+        # Direct lookup, falling back to pattern inference
         if normalized in self._location_map:
-            return self._location_map[normalized].system
+            system = self._location_map[normalized].system
+        else:
+            system = self._infer_system(location)
 
-        # Fallback to pattern inference
-        return self._infer_system(location)
+        self._system_cache[location] = system
+        return system
 
     def _infer_system(self, location: str) -> Optional[str]:
         """Infer system from location name patterns."""
@@ -6,8 +6,9 @@ for finding optimal routes from the mission scan database.
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from enum import Enum
-from typing import List, Dict, Any, Optional, Set, TYPE_CHECKING
+from typing import List, Dict, Any, Callable, Optional, Set, Tuple, TYPE_CHECKING
 from itertools import combinations
 from concurrent.futures import ProcessPoolExecutor, as_completed, TimeoutError
 import os
@@ -47,7 +48,7 @@ class OptimizationGoal(Enum):
         return names.get(goal, str(goal.value))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OptimizationWeights:
     """Weights for multi-goal optimization (each 0-100)."""
     max_reward: int = 100
@@ -104,24 +105,47 @@ class SearchStrategy(Enum):
         return names.get(strategy, str(strategy.value))
 
 
-@dataclass
-class PartialSolution:
-    """A partial solution for beam search."""
-    selected_scans: List[Dict[str, Any]]
-    locations: Set[str]
-    total_reward: float
-    total_scu: int
-    score: float = 0.0
-
-    def copy(self) -> 'PartialSolution':
-        """Create a copy of this solution."""
-        return PartialSolution(
-            selected_scans=list(self.selected_scans),
-            locations=set(self.locations),
-            total_reward=self.total_reward,
-            total_scu=self.total_scu,
-            score=self.score
-        )
+# Order of the per-goal score components used by the scoring helpers
+_SCORE_GOALS = (
+    OptimizationGoal.MAX_REWARD,
+    OptimizationGoal.FEWEST_STOPS,
+    OptimizationGoal.MIN_DISTANCE,
+    OptimizationGoal.BEST_REWARD_PER_STOP,
+    OptimizationGoal.BEST_REWARD_PER_SCU,
+)
+
+
+def _weight_vector(weights: OptimizationWeights) -> Tuple[float, ...]:
+    """Normalized weights as a tuple in _SCORE_GOALS order."""
+    norm_weights = weights.normalized()
+    return tuple(norm_weights.get(goal, 0) for goal in _SCORE_GOALS)
+
+
+def _weighted_normalized_scores(
+    rows: List[Tuple[float, ...]],
+    weight_vector: Tuple[float, ...]
+) -> List[float]:
+    """
+    Min-max normalize each score column and combine it with the weights.
+
+    Works on plain tuples so the per-candidate loop does no dict or
+    attribute lookups.
+    """
+    # (min, span) per column, or None when every row has the same value
+    scales = []
+    for column in zip(*rows):
+        min_val = min(column)
+        max_val = max(column)
+        scales.append((min_val, max_val - min_val) if max_val > min_val else None)
+
+    results = []
+    for row in rows:
+        weighted_score = 0.0
+        for raw, scale, weight in zip(row, scales, weight_vector):
+            normalized = 1.0 if scale is None else (raw - scale[0]) / scale[1]
+            weighted_score += normalized * weight
+        results.append(weighted_score)
+    return results
 
 
 # Search strategy constants
@@ -165,7 +189,7 @@ RANK_HIERARCHY = [
 ]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContractorRankFilter:
     """Rank filter for a specific contractor."""
     min_rank: Optional[str] = None
@@ -193,31 +217,40 @@ class ContractorRankFilter:
             return None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RouteFinderFilters:
-    """Filters for route finding."""
+    """Filters for route finding (immutable; build a new one to change a filter)."""
     max_stops: int = 5
     starting_location: Optional[str] = None
-    allowed_location_types: List[str] = field(default_factory=lambda: LocationType.all_types())
-    allowed_systems: List[str] = field(default_factory=lambda: ["Stanton", "Nyx", "Pyro"])
+    allowed_location_types: Tuple[str, ...] = field(default_factory=lambda: tuple(LocationType.all_types()))
+    allowed_systems: Tuple[str, ...] = ("Stanton", "Nyx", "Pyro")
     min_reward: Optional[float] = None
     max_reward: Optional[float] = None
     ship_key: str = "RSI_ZEUS_MK2_CL"
     round_trip: bool = False
-    # Per-contractor filtering: contractor name -> ContractorRankFilter
+    # Per-contractor filtering: (contractor name, ContractorRankFilter) pairs,
+    # kept as a tuple so the filters stay hashable
     # If None, all contractors allowed with any rank
-    # If dict, only listed contractors allowed with their specific rank filters
-    contractor_filters: Optional[Dict[str, ContractorRankFilter]] = None
+    # If a tuple, only listed contractors allowed with their specific rank filters
+    contractor_filters: Optional[Tuple[Tuple[str, ContractorRankFilter], ...]] = None
 
     def get_allowed_ranks_for_contractor(self, contractor: str) -> Optional[List[str]]:
         """Get list of allowed ranks for a specific contractor."""
         if self.contractor_filters is None:
             return None  # All ranks allowed (no contractor filtering)
 
-        if contractor not in self.contractor_filters:
-            return []  # Contractor not in allowed list
+        for name, rank_filter in self.contractor_filters:
+            if name == contractor:
+                return rank_filter.get_allowed_ranks()
 
-        return self.contractor_filters[contractor].get_allowed_ranks()
+        return []  # Contractor not in allowed list
+
+    def get_contractor_ranks(self) -> Optional[Dict[str, Optional[List[str]]]]:
+        """Map each allowed contractor to its allowed ranks (None if all contractors are allowed)."""
+        if self.contractor_filters is None:
+            return None
+
+        return {name: rank_filter.get_allowed_ranks() for name, rank_filter in self.contractor_filters}
 
 
 @dataclass
@@ -238,6 +271,18 @@ class RouteMetrics:
         if self.total_scu > 0:
             self.reward_per_scu = self.total_reward / self.total_scu
 
+    @cached_property
+    def detail_lines(self) -> Tuple[str, ...]:
+        """Display lines for the metrics, formatted on first use."""
+        return (
+            f"Total Reward: {self.total_reward:,.0f} aUEC",
+            f"Total SCU: {self.total_scu}",
+            f"Stops: {self.stop_count}",
+            f"Reward/Stop: {self.reward_per_stop:,.0f} aUEC",
+            f"Reward/SCU: {self.reward_per_scu:,.1f} aUEC",
+            f"Est. Distance: {self.estimated_distance:.1f}",
+        )
+
 
 @dataclass
 class CandidateRoute:
@@ -265,7 +310,8 @@ class RouteFinderService:
         location_classifier: LocationTypeClassifier = None,
         location_hierarchy: LocationHierarchy = None,
         ship_manager: ShipManager = None,
-        config: "Config" = None
+        config: "Config" = None,
+        should_stop: Optional[Callable[[], bool]] = None
     ):
         """
         Initialize the route finder service.
@@ -276,11 +322,14 @@ class RouteFinderService:
             location_hierarchy: Location hierarchy (created if None)
             ship_manager: Ship manager (created if None)
             config: Configuration object for parallel settings
+            should_stop: Optional callable polled between route batches;
+                a search returns early with what it has once it is True
         """
         self.scan_db = scan_db
         self.classifier = location_classifier or LocationTypeClassifier()
         self.hierarchy = location_hierarchy or LocationHierarchy()
         self.ship_manager = ship_manager or ShipManager()
+        self.should_stop = should_stop or (lambda: False)
 
         # Parallel processing settings
         self._config = config
@@ -341,15 +390,21 @@ class RouteFinderService:
         logger.info(f"Initial query returned {len(scans)} scans")
 
         # Apply additional filters (location types, systems, contractor/rank)
+        contractor_ranks = filters.get_contractor_ranks()
         results = []
         for scan in scans:
-            if self._scan_matches_filters(scan, filters):
+            if self._scan_matches_filters(scan, filters, contractor_ranks):
                 results.append(scan)
 
         logger.info(f"After filtering: {len(results)} scans match criteria")
         return results
 
-    def _scan_matches_filters(self, scan: Dict[str, Any], filters: RouteFinderFilters) -> bool:
+    def _scan_matches_filters(
+        self,
+        scan: Dict[str, Any],
+        filters: RouteFinderFilters,
+        contractor_ranks: Optional[Dict[str, Optional[List[str]]]]
+    ) -> bool:
         """Check if a scan matches all filter criteria."""
         mission_data = scan.get("mission_data", {})
         objectives = mission_data.get("objectives", [])
@@ -358,13 +413,13 @@ class RouteFinderService:
             return False
 
         # Check contractor and per-contractor rank filter
-        if filters.contractor_filters is not None:
+        if contractor_ranks is not None:
             contractor = mission_data.get("contracted_by", "")
-            if contractor not in filters.contractor_filters:
+            if contractor not in contractor_ranks:
                 return False  # Contractor not in allowed list
 
             # Check rank for this contractor
-            allowed_ranks = filters.contractor_filters[contractor].get_allowed_ranks()
+            allowed_ranks = contractor_ranks[contractor]
             if allowed_ranks is not None:
                 scan_rank = mission_data.get("rank")
                 if scan_rank and scan_rank not in allowed_ranks:
@@ -436,8 +491,9 @@ class RouteFinderService:
         matching_scans = self.filter_missions(filters)
         self._last_pool_size = len(matching_scans)
 
-        if not matching_scans:
-            logger.info("No matching missions found")
+        if not matching_scans or self.should_stop():
+            if not matching_scans:
+                logger.info("No matching missions found")
             return []
 
         # Build more routes to support pagination
@@ -499,6 +555,9 @@ class RouteFinderService:
 
         for size in range(1, max_missions + 1):
             for combo in combinations(range(len(scans)), size):
+                if self.should_stop():
+                    return candidates
+
                 # Create unique key for this combination
                 combo_key = frozenset(combo)
                 if combo_key in seen_combinations:
@@ -570,6 +629,10 @@ class RouteFinderService:
             }
 
             for future in as_completed(futures, timeout=self._worker_timeout * len(batches)):
+                if self.should_stop():
+                    for pending in futures:
+                        pending.cancel()
+                    break
                 try:
                     results = future.result(timeout=self._worker_timeout)
                     for result in results:
@@ -676,7 +739,7 @@ class RouteFinderService:
         num_starts = min(len(scored_scans), max(20, max_routes * 2))
 
         for start_idx in range(num_starts):
-            if len(candidates) >= max_routes:
+            if len(candidates) >= max_routes or self.should_stop():
                 break
 
             candidate = self._greedy_from_start(
@@ -826,6 +889,10 @@ class RouteFinderService:
             }
 
             for future in as_completed(futures, timeout=self._worker_timeout * num_starts):
+                if self.should_stop():
+                    for pending in futures:
+                        pending.cancel()
+                    break
                 try:
                     result = future.result(timeout=self._worker_timeout)
                     if result:
@@ -875,90 +942,46 @@ class RouteFinderService:
         Maintains top K partial solutions at each step, exploring multiple
         paths to find better route combinations.
         """
-        goal = weights.get_dominant_goal()
+        from src.services.route_finder_workers import beam_search_worker
 
-        # Initialize beam with empty solution
-        beam: List[PartialSolution] = [
-            PartialSolution(
-                selected_scans=[],
-                locations=set(),
-                total_reward=0,
-                total_scu=0,
-                score=0
-            )
-        ]
-
-        # Pre-compute scan data
-        scan_data = []
-        for scan in scans:
-            scan_data.append({
-                'scan': scan,
-                'locations': self._get_scan_locations(scan),
-                'reward': self._get_scan_reward(scan),
-                'scu': self._get_scan_scu(scan),
-            })
-
-        # Iterate beam search
-        iterations = 0
-        max_iterations = min(len(scans), filters.max_stops * 2)
-
-        while iterations < max_iterations:
-            iterations += 1
-            next_beam: List[PartialSolution] = []
-
-            for partial in beam:
-                # Track which scans are already selected (by index)
-                selected_indices = set()
-                for sel_scan in partial.selected_scans:
-                    for i, sd in enumerate(scan_data):
-                        if sd['scan'] is sel_scan:
-                            selected_indices.add(i)
-                            break
-
-                # Try adding each remaining scan
-                for i, sd in enumerate(scan_data):
-                    if i in selected_indices:
-                        continue
-
-                    # Check if adding would exceed max_stops
-                    new_locs = partial.locations | sd['locations']
-                    if len(new_locs) > filters.max_stops:
-                        continue
-
-                    # Create new partial solution
-                    new_partial = partial.copy()
-                    new_partial.selected_scans.append(sd['scan'])
-                    new_partial.locations = new_locs
-                    new_partial.total_reward += sd['reward']
-                    new_partial.total_scu += sd['scu']
-                    new_partial.score = self._score_partial_solution(new_partial, weights)
-
-                    next_beam.append(new_partial)
+        goal = weights.get_dominant_goal()
 
-            if not next_beam:
-                break  # No more expansions possible
+        # Only per-scan totals go to the worker process
+        work_item = (
+            [
+                (frozenset(self._get_scan_locations(scan)), self._get_scan_reward(scan), self._get_scan_scu(scan))
+                for scan in scans
+            ],
+            filters.max_stops,
+            _weight_vector(weights),
+            BEAM_WIDTH,
+        )
 
-            # Keep top K solutions (beam width)
-            next_beam.sort(key=lambda p: p.score, reverse=True)
-            beam = next_beam[:BEAM_WIDTH]
+        # The beam itself is pure CPU work, so run it outside this interpreter
+        try:
+            executor = self._get_executor()
+            beam = executor.submit(beam_search_worker, work_item).result(timeout=self._worker_timeout)
+        except Exception as e:
+            logger.warning(f"Parallel beam search failed, falling back to sequential: {e}")
+            beam = beam_search_worker(work_item)
 
         # Build actual routes from final beam solutions
         candidates = []
         seen_keys: Set[frozenset] = set()
 
-        for partial in beam:
-            if not partial.selected_scans:
+        for selected in beam:
+            if not selected:
                 continue
 
             # Dedup by scan set
-            key = frozenset(id(s) for s in partial.selected_scans)
+            key = frozenset(selected)
             if key in seen_keys:
                 continue
             seen_keys.add(key)
 
             # Try to build actual route
             candidate = self._try_build_route(
-                partial.selected_scans, filters, goal, ship_capacity
+                [scans[i] for i in selected], filters, goal, ship_capacity
             )
             if candidate:
                 candidates.append(candidate)
@@ -1057,36 +1080,6 @@ class RouteFinderService:
 
         return affinity
 
-    def _score_partial_solution(
-        self,
-        partial: PartialSolution,
-        weights: OptimizationWeights
-    ) -> float:
-        """
-        Score a partial solution for beam search ranking.
-
-        Uses similar logic to final scoring but works on estimated data.
-        """
-        norm_weights = weights.normalized()
-        estimated_stops = len(partial.locations)
-
-        if estimated_stops == 0 or partial.total_reward == 0:
-            return 0.0
-
-        # Calculate component scores
-        scores = {
-            OptimizationGoal.MAX_REWARD: partial.total_reward,
-            OptimizationGoal.FEWEST_STOPS: partial.total_reward / (estimated_stops ** 1.5),
-            OptimizationGoal.MIN_DISTANCE: partial.total_reward / (estimated_stops ** 1.5),
-            OptimizationGoal.BEST_REWARD_PER_STOP: partial.total_reward / estimated_stops,
-            OptimizationGoal.BEST_REWARD_PER_SCU: (
-                partial.total_reward / partial.total_scu if partial.total_scu > 0 else 0
-            ),
-        }
-
-        # Weighted sum
-        return sum(scores.get(goal, 0) * w for goal, w in norm_weights.items())
-
     def _try_build_route(
         self,
         mission_scans: List[Dict[str, Any]],
@@ -1207,32 +1200,25 @@ class RouteFinderService:
             estimated_distance=estimated_distance
         )
 
-    def _calculate_raw_scores(self, metrics: RouteMetrics) -> Dict[OptimizationGoal, float]:
-        """Calculate raw scores for all optimization goals."""
-        scores = {}
+    def _raw_score_row(self, metrics: RouteMetrics) -> Tuple[float, ...]:
+        """Calculate raw scores for all optimization goals, in _SCORE_GOALS order."""
+        reward = metrics.total_reward
 
         # MAX_REWARD: higher is better
-        scores[OptimizationGoal.MAX_REWARD] = metrics.total_reward
-
         # FEWEST_STOPS: lower stops is better -> use reward/stops^1.5
         if metrics.stop_count > 0:
-            scores[OptimizationGoal.FEWEST_STOPS] = metrics.total_reward / (metrics.stop_count ** 1.5)
+            fewest_stops = reward / (metrics.stop_count ** 1.5)
         else:
-            scores[OptimizationGoal.FEWEST_STOPS] = 0
+            fewest_stops = 0
 
         # MIN_DISTANCE: lower distance is better -> use reward/distance^1.5
         if metrics.estimated_distance > 0:
-            scores[OptimizationGoal.MIN_DISTANCE] = metrics.total_reward / (metrics.estimated_distance ** 1.5)
+            min_distance = reward / (metrics.estimated_distance ** 1.5)
         else:
-            scores[OptimizationGoal.MIN_DISTANCE] = metrics.total_reward
-
-        # REWARD_PER_STOP: higher is better
-        scores[OptimizationGoal.BEST_REWARD_PER_STOP] = metrics.reward_per_stop
+            min_distance = reward
 
-        # REWARD_PER_SCU: higher is better
-        scores[OptimizationGoal.BEST_REWARD_PER_SCU] = metrics.reward_per_scu
-
-        return scores
+        # REWARD_PER_STOP / REWARD_PER_SCU: higher is better
+        return (reward, fewest_stops, min_distance, metrics.reward_per_stop, metrics.reward_per_scu)
 
     def _calculate_score(self, metrics: RouteMetrics, goal: OptimizationGoal) -> float:
         """Calculate score for a route based on optimization goal."""
@@ -1275,44 +1261,12 @@ class RouteFinderService:
         if not candidates:
             return
 
-        norm_weights = weights.normalized()
-
-        # Collect raw scores per goal for all candidates
-        all_raw_scores: Dict[OptimizationGoal, List[float]] = {
-            goal: [] for goal in OptimizationGoal
-        }
+        # Raw scores are computed once per candidate and scored as plain tuples
+        rows = [self._raw_score_row(candidate.metrics) for candidate in candidates]
+        scores = _weighted_normalized_scores(rows, _weight_vector(weights))
 
-        for candidate in candidates:
-            goal_scores = self._calculate_raw_scores(candidate.metrics)
-            for goal, score in goal_scores.items():
-                all_raw_scores[goal].append(score)
-
-        # Calculate min/max per goal for normalization
-        min_max: Dict[OptimizationGoal, tuple] = {}
-        for goal in OptimizationGoal:
-            scores = all_raw_scores[goal]
-            min_val = min(scores) if scores else 0
-            max_val = max(scores) if scores else 0
-            min_max[goal] = (min_val, max_val)
-
-        # Normalize and weight each candidate's score
-        for candidate in candidates:
-            weighted_score = 0.0
-            goal_scores = self._calculate_raw_scores(candidate.metrics)
-
-            for goal, raw in goal_scores.items():
-                min_val, max_val = min_max[goal]
-
-                # Normalize to [0, 1] range
-                if max_val > min_val:
-                    normalized = (raw - min_val) / (max_val - min_val)
-                else:
-                    normalized = 1.0  # All candidates have same value
-
-                # Apply weight
-                weighted_score += normalized * norm_weights.get(goal, 0)
-
-            candidate.score = weighted_score
+        for candidate, score in zip(candidates, scores):
+            candidate.score = score
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about available missions."""
@@ -345,3 +345,101 @@ def batch_combinatorial_worker(args: Tuple) -> List[Dict[str, Any]]:
     except Exception as e:
         logger.debug(f"Batch combinatorial worker failed: {e}")
         return []
+
+
+def score_partial_solution(
+    stop_count: int,
+    total_reward: float,
+    total_scu: int,
+    weight_vector: Tuple[float, ...]
+) -> float:
+    """
+    Score a partial beam search solution from estimated totals.
+
+    Args:
+        stop_count: Number of distinct locations selected so far
+        total_reward: Summed reward of the selected scans
+        total_scu: Summed SCU of the selected scans
+        weight_vector: Normalized goal weights in the service's scoring order
+
+    Returns:
+        Weighted score (0.0 for empty solutions).
+    """
+    if stop_count == 0 or total_reward == 0:
+        return 0.0
+
+    # Component scores in scoring order
+    stop_score = total_reward / (stop_count ** 1.5)
+    scores = (
+        total_reward,
+        stop_score,
+        stop_score,
+        total_reward / stop_count,
+        total_reward / total_scu if total_scu > 0 else 0,
+    )
+
+    return sum(score * w for score, w in zip(scores, weight_vector))
+
+
+def beam_search_worker(args: Tuple) -> List[Tuple[int, ...]]:
+    """
+    Worker function for beam search over scan combinations.
+
+    Only per-scan totals are shipped to the worker; the caller rebuilds
+    routes from the returned indices.
+
+    Args:
+        args: Tuple of (scan_data, max_stops, weight_vector, beam_width)
+              - scan_data: List of (locations, reward, scu) tuples per scan
+              - max_stops: int
+              - weight_vector: Normalized goal weights in scoring order
+              - beam_width: Partial solutions kept per iteration
+
+    Returns:
+        Selected scan indices of each solution in the final beam, best first.
+    """
+    scan_data, max_stops, weight_vector, beam_width = args
+
+    # Location sets as bitmasks over a shared index: union is |, size is bit_count()
+    location_bits: Dict[str, int] = {}
+    scan_rows = []
+    for scan_locations, scan_reward, scan_scu in scan_data:
+        mask = 0
+        for location in scan_locations:
+            mask |= 1 << location_bits.setdefault(location, len(location_bits))
+        scan_rows.append((mask, scan_reward, scan_scu))
+
+    # Partial solutions as (selected indices, location mask, reward, scu, score)
+    beam = [((), 0, 0, 0, 0.0)]
+    max_iterations = min(len(scan_rows), max_stops * 2)
+
+    for _ in range(max_iterations):
+        next_beam = []
+
+        for selected, locations, reward, scu, _ in beam:
+            selected_set = set(selected)
+
+            # Try adding each remaining scan
+            for i, (scan_locations, scan_reward, scan_scu) in enumerate(scan_rows):
+                if i in selected_set:
+                    continue
+
+                # Check if adding would exceed max_stops
+                new_locations = locations | scan_locations
+                stop_count = new_locations.bit_count()
+                if stop_count > max_stops:
+                    continue
+
+                new_reward = reward + scan_reward
+                new_scu = scu + scan_scu
+                score = score_partial_solution(stop_count, new_reward, new_scu, weight_vector)
+                next_beam.append((selected + (i,), new_locations, new_reward, new_scu, score))
+
+        if not next_beam:
+            break  # No more expansions possible
+
+        # Keep top K solutions (beam width)
+        next_beam.sort(key=lambda p: p[4], reverse=True)
+        beam = next_beam[:beam_width]
+
+    return [selected for selected, *_ in beam]
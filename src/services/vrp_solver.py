@@ -361,6 +361,7 @@ class VRPSolver:
 
         improved = True
         best_route = route[:]
+        best_cost = self._calculate_route_cost(best_route)
 
         while improved:
             improved = False
@@ -370,13 +371,13 @@ class VRPSolver:
                     # Try reversing segment [i+1, j]
                     new_route = best_route[:i+1] + best_route[i+1:j+1][::-1] + best_route[j+1:]
 
-                    # Check if new route is feasible
-                    if self._is_sequence_feasible(new_route):
-                        # Check if it's better
-                        if self._calculate_route_cost(new_route) < self._calculate_route_cost(best_route):
-                            best_route = new_route
-                            improved = True
-                            break
+                    # Check if it's better (cheap) before checking feasibility
+                    new_cost = self._calculate_route_cost(new_route)
+                    if new_cost < best_cost and self._is_sequence_feasible(new_route):
+                        best_route = new_route
+                        best_cost = new_cost
+                        improved = True
+                        break
 
                 if improved:
                     break
@@ -394,6 +395,7 @@ class VRPSolver:
 
         improved = True
         best_route = route[:]
+        best_cost = self._calculate_route_cost(best_route)
 
         while improved:
             improved = False
@@ -410,12 +412,13 @@ class VRPSolver:
                     new_route = best_route[:i] + best_route[i+1:]
                     new_route = new_route[:j] + [node] + new_route[j:]
 
-                    # Check feasibility
-                    if self._is_sequence_feasible(new_route):
-                        if self._calculate_route_cost(new_route) < self._calculate_route_cost(best_route):
-                            best_route = new_route
-                            improved = True
-                            break
+                    # Check if it's better (cheap) before checking feasibility
+                    new_cost = self._calculate_route_cost(new_route)
+                    if new_cost < best_cost and self._is_sequence_feasible(new_route):
+                        best_route = new_route
+                        best_cost = new_cost
+                        improved = True
+                        break
 
                 if improved:
                     break
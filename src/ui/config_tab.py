@@ -548,7 +548,7 @@ class ConfigTab(QWidget):
             if "capture" not in self.config.settings["hotkeys"]:
                 self.config.settings["hotkeys"]["capture"] = {}
 
-            self.config.settings["hotkeys"]["capture"]["modifiers"] = capture_modifiers
+            self.config.settings["hotkeys"]["capture"]["modifiers"] = list(capture_modifiers)
             self.config.settings["hotkeys"]["capture"]["key"] = capture_key
             self.config.settings["hotkeys"]["capture"]["description"] = "Capture & extract mission from screen"
 
@@ -558,7 +558,7 @@ class ConfigTab(QWidget):
             if "save" not in self.config.settings["hotkeys"]:
                 self.config.settings["hotkeys"]["save"] = {}
 
-            self.config.settings["hotkeys"]["save"]["modifiers"] = save_modifiers
+            self.config.settings["hotkeys"]["save"]["modifiers"] = list(save_modifiers)
             self.config.settings["hotkeys"]["save"]["key"] = save_key
             self.config.settings["hotkeys"]["save"]["description"] = "Add mission to hauling list"
 
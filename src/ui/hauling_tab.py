@@ -244,22 +244,21 @@ class HaulingTab(QWidget):
 
     def _display_flat(self, missions: list):
         """Display missions in flat list."""
-        for mission in missions:
-            self._add_mission_item(self.tree, mission)
+        self.tree.addTopLevelItems([self._make_mission_item(mission) for mission in missions])
 
     def _display_grouped_by_source(self, missions: list):
         """Display missions grouped by source location."""
         groups = RouteOptimizer.group_by_source(missions)
 
         for source, group_missions in sorted(groups.items()):
-            # Create group item
-            group_item = QTreeWidgetItem(self.tree)
+            # Create group item with all column texts in one call
             totals = RouteOptimizer.calculate_group_totals(group_missions)
-
-            group_item.setText(0, f"📍 {source}")
-            group_item.setText(1, f"{totals['reward']:,} aUEC")
-            group_item.setText(2, f"{totals['scu']} SCU")
-            group_item.setText(3, f"{totals['missions']} missions")
+            group_item = QTreeWidgetItem(self.tree, [
+                f"📍 {source}",
+                f"{totals['reward']:,} aUEC",
+                f"{totals['scu']} SCU",
+                f"{totals['missions']} missions",
+            ])
 
             # Make group bold
             font = group_item.font(0)
@@ -267,9 +266,8 @@ class HaulingTab(QWidget):
             for col in range(4):
                 group_item.setFont(col, font)
 
-            # Add missions to group
-            for mission in group_missions:
-                self._add_mission_item(group_item, mission)
+            # Add missions to group in one batch
+            group_item.addChildren([self._make_mission_item(mission) for mission in group_missions])
 
             group_item.setExpanded(True)
 
@@ -278,14 +276,14 @@ class HaulingTab(QWidget):
         groups = RouteOptimizer.group_by_destination(missions)
 
         for dest, group_missions in sorted(groups.items()):
-            # Create group item
-            group_item = QTreeWidgetItem(self.tree)
+            # Create group item with all column texts in one call
             totals = RouteOptimizer.calculate_group_totals(group_missions)
-
-            group_item.setText(0, f"📍 {dest}")
-            group_item.setText(1, f"{totals['reward']:,} aUEC")
-            group_item.setText(2, f"{totals['scu']} SCU")
-            group_item.setText(3, f"{totals['missions']} missions")
+            group_item = QTreeWidgetItem(self.tree, [
+                f"📍 {dest}",
+                f"{totals['reward']:,} aUEC",
+                f"{totals['scu']} SCU",
+                f"{totals['missions']} missions",
+            ])
 
             # Make group bold
             font = group_item.font(0)
@@ -293,19 +291,13 @@ class HaulingTab(QWidget):
             for col in range(4):
                 group_item.setFont(col, font)
 
-            # Add missions to group
-            for mission in group_missions:
-                self._add_mission_item(group_item, mission)
+            # Add missions to group in one batch
+            group_item.addChildren([self._make_mission_item(mission) for mission in group_missions])
 
             group_item.setExpanded(True)
 
-    def _add_mission_item(self, parent, mission: dict):
-        """Add a mission item to tree."""
-        item = QTreeWidgetItem(parent)
-
-        # Store mission ID
-        item.setData(0, Qt.ItemDataRole.UserRole, mission.get("id"))
-
+    def _make_mission_item(self, mission: dict) -> QTreeWidgetItem:
+        """Create a detached mission item for batch insertion."""
         # Mission details
         objectives = mission.get("objectives", [])
         sources = ", ".join(set(obj.get("collect_from", "") for obj in objectives))
@@ -314,21 +306,18 @@ class HaulingTab(QWidget):
         cargo_types = ", ".join(set(obj.get("cargo_type", "Unknown") for obj in objectives))
 
         details = f"{cargo_types} ({total_scu} SCU): {sources} → {destinations}"
-        item.setText(0, details)
-
-        # Reward
         reward = mission.get("reward", 0)
-        item.setText(1, f"{reward:,} aUEC")
-        item.setTextAlignment(1, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-
-        # Availability
         availability = mission.get("availability", "")
-        item.setText(2, availability)
-        item.setTextAlignment(2, Qt.AlignmentFlag.AlignCenter)
-
-        # Status
         status = mission.get("status", "active").capitalize()
-        item.setText(3, status)
+
+        # Details, reward, availability and status set in one call
+        item = QTreeWidgetItem([details, f"{reward:,} aUEC", availability, status])
+
+        # Store mission ID
+        item.setData(0, Qt.ItemDataRole.UserRole, mission.get("id"))
+
+        item.setTextAlignment(1, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        item.setTextAlignment(2, Qt.AlignmentFlag.AlignCenter)
         item.setTextAlignment(3, Qt.AlignmentFlag.AlignCenter)
 
         # Color code by status
@@ -339,6 +328,8 @@ class HaulingTab(QWidget):
             for col in range(4):
                 item.setForeground(col, Qt.GlobalColor.darkRed)
 
+        return item
+
     def _update_route_suggestions(self, missions: list):
         """Update route suggestions panel."""
         if not missions:
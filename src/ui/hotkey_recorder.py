@@ -8,7 +8,13 @@ from PyQt6.QtWidgets import QLineEdit
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QKeyEvent, QFocusEvent
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+# Key code bounds for letter/digit ranges, resolved once instead of per event
+_KEY_A = int(Qt.Key.Key_A)
+_KEY_Z = int(Qt.Key.Key_Z)
+_KEY_0 = int(Qt.Key.Key_0)
+_KEY_9 = int(Qt.Key.Key_9)
 
 
 class HotkeyRecorder(QLineEdit):
@@ -19,8 +25,8 @@ class HotkeyRecorder(QLineEdit):
     The combination is recorded and displayed.
     """
 
-    # Emitted when a new hotkey is recorded: (modifiers_list, key_name)
-    hotkey_changed = pyqtSignal(list, str)
+    # Emitted when a new hotkey is recorded: (modifiers_tuple, key_name)
+    hotkey_changed = pyqtSignal(tuple, str)
 
     # Modifier key codes
     MODIFIER_KEYS = {
@@ -87,6 +93,18 @@ class HotkeyRecorder(QLineEdit):
         Qt.Key.Key_division: 'num_divide',
     }
 
+    # Single lookup table: mapped keys plus letters (A-Z) and digits (0-9)
+    _KEY_TABLE = {
+        **{int(key): name for key, name in KEY_INTERNAL_NAMES.items()},
+        **{code: chr(code).lower() for code in range(_KEY_A, _KEY_Z + 1)},
+        **{code: chr(code) for code in range(_KEY_0, _KEY_9 + 1)},
+    }
+
+    # Base names that get a num_ prefix when pressed on the numpad
+    _NUMPAD_CAPABLE = frozenset(
+        ('minus', 'plus', 'asterisk', 'slash', 'period', 'enter') + tuple('0123456789')
+    )
+
     # Display names for internal key names
     KEY_DISPLAY_MAP = {
         'print_screen': 'Print Screen',
@@ -134,13 +152,37 @@ class HotkeyRecorder(QLineEdit):
         'num_period': 'Num .',
     }
 
+    # Stylesheets for the recording and idle states
+    _STYLE_RECORDING = """
+        QLineEdit {
+            background-color: #3d3d3d;
+            border: 2px solid #4CAF50;
+            padding: 4px 8px;
+        }
+    """
+
+    _STYLE_IDLE = """
+        QLineEdit {
+            background-color: #2d2d2d;
+            border: 1px solid #3d3d3d;
+            padding: 4px 8px;
+        }
+        QLineEdit:hover {
+            border: 1px solid #4d4d4d;
+        }
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         # Current hotkey state
         self._modifiers: List[str] = []
+        # Immutable snapshot of _modifiers handed out by get_hotkey()
+        self._modifiers_tuple: Tuple[str, ...] = ()
         self._key: str = ''
         self._recording = False
+        self._style_state: Optional[bool] = None
+        self._last_text = ''
 
         # Setup UI
         self.setReadOnly(True)
@@ -152,25 +194,15 @@ class HotkeyRecorder(QLineEdit):
 
     def _update_style(self):
         """Update widget style based on recording state."""
+        # Re-applying an identical stylesheet still forces a full re-polish
+        if self._style_state == self._recording:
+            return
+        self._style_state = self._recording
+
         if self._recording:
-            self.setStyleSheet("""
-                QLineEdit {
-                    background-color: #3d3d3d;
-                    border: 2px solid #4CAF50;
-                    padding: 4px 8px;
-                }
-            """)
+            self.setStyleSheet(self._STYLE_RECORDING)
         else:
-            self.setStyleSheet("""
-                QLineEdit {
-                    background-color: #2d2d2d;
-                    border: 1px solid #3d3d3d;
-                    padding: 4px 8px;
-                }
-                QLineEdit:hover {
-                    border: 1px solid #4d4d4d;
-                }
-            """)
+            self.setStyleSheet(self._STYLE_IDLE)
 
     def set_hotkey(self, modifiers: List[str], key: str):
         """
@@ -181,24 +213,21 @@ class HotkeyRecorder(QLineEdit):
             key: Key name (e.g., 'print_screen', 'f5')
         """
         self._modifiers = [m.lower() for m in modifiers] if modifiers else []
+        self._modifiers_tuple = tuple(self._modifiers)
         self._key = key.lower() if key else ''
         self._update_display()
 
-    def get_hotkey(self) -> Tuple[List[str], str]:
+    def get_hotkey(self) -> Tuple[Tuple[str, ...], str]:
         """
         Get the current hotkey as (modifiers, key).
 
         Returns:
-            Tuple of (modifiers_list, key_name)
+            Tuple of (modifiers_tuple, key_name)
         """
-        return (self._modifiers.copy(), self._key)
+        return (self._modifiers_tuple, self._key)
 
     def _update_display(self):
         """Update the displayed text to show current hotkey."""
-        if not self._key and not self._modifiers:
-            self.setText("")
-            return
-
         parts = []
 
         # Add modifiers in consistent order
@@ -217,7 +246,12 @@ class HotkeyRecorder(QLineEdit):
             display_key = self._internal_to_display(self._key)
             parts.append(display_key)
 
-        self.setText(' + '.join(parts))
+        text = ' + '.join(parts)
+
+        # Skip setText when nothing changed to avoid redundant Qt updates
+        if text != self._last_text:
+            self._last_text = text
+            self.setText(text)
 
     def _internal_to_display(self, internal_name: str) -> str:
         """Convert internal key name to display name."""
@@ -289,33 +323,24 @@ class HotkeyRecorder(QLineEdit):
 
         if new_key:
             self._modifiers = new_modifiers
+            self._modifiers_tuple = tuple(new_modifiers)
             self._key = new_key
             self._update_display()
-            self.hotkey_changed.emit(self._modifiers, self._key)
+            self.hotkey_changed.emit(self._modifiers_tuple, self._key)
 
             # Clear focus after recording
             self.clearFocus()
 
     def _get_key_name(self, key: int, is_numpad: bool = False, text: str = '') -> str:
         """Get internal key name from Qt key code."""
-        # Check mapping first
-        if key in self.KEY_INTERNAL_NAMES:
-            base_name = self.KEY_INTERNAL_NAMES[key]
+        # Mapped keys, letters and digits
+        base_name = HotkeyRecorder._KEY_TABLE.get(key)
+        if base_name is not None:
             # For keys that can be on numpad, prefix with num_
-            if is_numpad and base_name in ('minus', 'plus', 'asterisk', 'slash', 'period', 'enter'):
+            if is_numpad and base_name in HotkeyRecorder._NUMPAD_CAPABLE:
                 return f'num_{base_name}'
             return base_name
 
-        # Letter keys (A-Z)
-        if Qt.Key.Key_A <= key <= Qt.Key.Key_Z:
-            return chr(key).lower()
-
-        # Number keys (0-9) - check numpad
-        if Qt.Key.Key_0 <= key <= Qt.Key.Key_9:
-            if is_numpad:
-                return f'num_{chr(key)}'
-            return chr(key)
-
         # Fallback: use event text for printable characters
         if text and len(text) == 1 and text.isprintable():
             char = text.lower()
@@ -4,6 +4,9 @@ Main application window with PyQt6.
 Modern tabbed interface with Capture, Hauling, Route Planner, and Configuration tabs.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
 from PyQt6.QtWidgets import (
     QMainWindow, QTabWidget, QWidget, QVBoxLayout,
     QStatusBar, QMessageBox
@@ -23,13 +26,11 @@ from src.sync_service import SyncService
 from src.sound_service import init_sound_service
 from src.logger import get_logger
 
-# Import tabs (will be created)
+# Import tabs (Scan Database, Route Finder and Screenshot Parser are
+# imported on first activation, see _ensure_tab)
 from src.ui.capture_tab import CaptureTab
 from src.ui.hauling_tab import HaulingTab
 from src.ui.route_planner_tab import RoutePlannerTab
-from src.ui.scan_database_tab import ScanDatabaseTab
-from src.ui.route_finder_tab import RouteFinderTab
-from src.ui.screenshot_parser_tab import ScreenshotParserTab
 from src.ui.config_tab import ConfigTab
 from src.ui.welcome_dialog import WelcomeDialog
 from src.ui.styles import get_stylesheet
@@ -37,6 +38,10 @@ from src.ship_profiles import ShipManager
 
 logger = get_logger()
 
+# Field extractors for converting stored mission dicts (see _get_active_missions)
+_OBJECTIVE_FIELDS = itemgetter('collect_from', 'deliver_to', 'scu_amount', 'cargo_type', 'mission_id')
+_MISSION_FIELDS = itemgetter('id', 'availability', 'timestamp', 'status')
+
 
 class MainWindow(QMainWindow):
     """Main application window with modern PyQt6 interface."""
@@ -70,6 +75,14 @@ class MainWindow(QMainWindow):
         # Global hotkey manager
         self.hotkey_manager = GlobalHotkeyManager()
 
+        # Background worker for blocking tasks (Discord login)
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sc-bg")
+        self._closing = False
+
+        # Converted active missions, keyed by mission manager revision
+        self._active_missions_cache = None
+        self._active_missions_rev = -1
+
         self._setup_ui()
         self._apply_theme()
         self._restore_geometry()
@@ -102,7 +115,7 @@ class MainWindow(QMainWindow):
         self.tab_widget.setDocumentMode(True)
         layout.addWidget(self.tab_widget)
 
-        # Create tabs
+        # Create tabs that are shown first or updated from main window callbacks
         self.capture_tab = CaptureTab(
             self.config,
             self.api_client,
@@ -122,26 +135,20 @@ class MainWindow(QMainWindow):
             self.config,
             self.mission_manager
         )
-        self.scan_database_tab = ScanDatabaseTab(self.scan_db, self.config, self.discord_auth, self.location_matcher)
-        self.route_finder_tab = RouteFinderTab(
-            self.config,
-            self.scan_db,
-            self.location_matcher,
-            ShipManager(),
-            self.sync_service
-        )
-        self.screenshot_parser_tab = ScreenshotParserTab(
-            self.config,
-            self.api_client,
-            self.location_matcher,
-            self.cargo_matcher,
-            self.scan_db
-        )
         self.config_tab = ConfigTab(self.config, self.discord_auth)
 
+        # Remaining tabs are created on first activation (index -> factory)
+        self.scan_database_tab = None
+        self.route_finder_tab = None
+        self.screenshot_parser_tab = None
+        self._tab_factories = {
+            3: self._create_scan_database_tab,
+            4: self._create_route_finder_tab,
+            5: self._create_screenshot_parser_tab,
+        }
+
         # Connect scan added signals
-        self.capture_tab.scan_added.connect(self.scan_database_tab.add_scan_to_table)
-        self.screenshot_parser_tab.scan_added.connect(self.scan_database_tab.add_scan_to_table)
+        self.capture_tab.scan_added.connect(self._on_scan_added)
 
         # Connect status message signal from capture tab
         self.capture_tab.status_message.connect(self._on_capture_status_message)
@@ -149,15 +156,14 @@ class MainWindow(QMainWindow):
         # Connect Discord auth signals
         self.config_tab.discord_login_requested.connect(self._on_discord_login_requested)
         self.config_tab.discord_logout_requested.connect(self._on_discord_logout_requested)
-        self.scan_database_tab.login_requested.connect(self._on_discord_login_requested)
 
-        # Add tabs
+        # Add tabs (placeholders for lazily created tabs)
         self.tab_widget.addTab(self.capture_tab, "Capture")
         self.tab_widget.addTab(self.hauling_tab, "Hauling")
         self.tab_widget.addTab(self.route_planner_tab, "Route Planner")
-        self.tab_widget.addTab(self.scan_database_tab, "Scan Database")
-        self.tab_widget.addTab(self.route_finder_tab, "Route Finder")
-        self.tab_widget.addTab(self.screenshot_parser_tab, "Screenshot Parser")
+        self.tab_widget.addTab(QWidget(), "Scan Database")
+        self.tab_widget.addTab(QWidget(), "Route Finder")
+        self.tab_widget.addTab(QWidget(), "Screenshot Parser")
         self.tab_widget.addTab(self.config_tab, "Configuration")
 
         # Status bar
@@ -165,12 +171,80 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
 
+        # Tabs that refresh their data when switched to (index -> refresh)
+        self._tab_refreshers = {
+            1: self.hauling_tab.refresh,
+            2: self.route_planner_tab.refresh,
+        }
+
         # Connect signals
         self.tab_widget.currentChanged.connect(self._on_tab_changed)
         self.config_tab.config_saved.connect(self._on_config_saved)
 
         logger.debug("UI setup complete")
 
+    def _create_scan_database_tab(self) -> QWidget:
+        """Create the Scan Database tab."""
+        from src.ui.scan_database_tab import ScanDatabaseTab
+
+        self.scan_database_tab = ScanDatabaseTab(self.scan_db, self.config, self.discord_auth, self.location_matcher)
+        self.scan_database_tab.login_requested.connect(self._on_discord_login_requested)
+        return self.scan_database_tab
+
+    def _create_route_finder_tab(self) -> QWidget:
+        """Create the Route Finder tab."""
+        from src.ui.route_finder_tab import RouteFinderTab
+
+        self.route_finder_tab = RouteFinderTab(
+            self.config,
+            self.scan_db,
+            self.location_matcher,
+            ShipManager(),
+            self.sync_service
+        )
+        self._tab_refreshers[4] = self.route_finder_tab.refresh
+        return self.route_finder_tab
+
+    def _create_screenshot_parser_tab(self) -> QWidget:
+        """Create the Screenshot Parser tab."""
+        from src.ui.screenshot_parser_tab import ScreenshotParserTab
+
+        self.screenshot_parser_tab = ScreenshotParserTab(
+            self.config,
+            self.api_client,
+            self.location_matcher,
+            self.cargo_matcher,
+            self.scan_db
+        )
+        self.screenshot_parser_tab.scan_added.connect(self._on_scan_added)
+        return self.screenshot_parser_tab
+
+    def _ensure_tab(self, index: int):
+        """Replace a placeholder with the real tab the first time it is shown."""
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+
+        tab_name = self.tab_widget.tabText(index)
+        tab = factory()
+        logger.debug(f"Created tab on first use: {tab_name}")
+
+        # Swap without re-entering _on_tab_changed
+        self.tab_widget.blockSignals(True)
+        try:
+            placeholder = self.tab_widget.widget(index)
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, tab, tab_name)
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+    def _on_scan_added(self, scan: dict):
+        """Forward newly added scans to the scan database tab if it exists."""
+        if self.scan_database_tab is not None:
+            self.scan_database_tab.add_scan_to_table(scan)
+
     def _apply_theme(self):
         """Apply the modern dark theme."""
         self.setStyleSheet(get_stylesheet())
@@ -195,25 +269,54 @@ class MainWindow(QMainWindow):
 
     def _on_tab_changed(self, index: int):
         """Handle tab changes."""
-        tab_name = self.tab_widget.tabText(index)
-        logger.debug(f"Switched to tab: {tab_name}")
+        self._ensure_tab(index)
+
+        logger.debug(f"Switched to tab: {self.tab_widget.tabText(index)}")
 
         # Refresh data when switching to certain tabs
-        if index == 1:  # Hauling tab
-            self.hauling_tab.refresh()
-        elif index == 2:  # Route Planner tab
-            self.route_planner_tab.refresh()
-        elif index == 4:  # Route Finder tab
-            self.route_finder_tab.refresh()
+        refresh = self._tab_refreshers.get(index)
+        if refresh is not None:
+            refresh()
 
     def _get_active_missions(self):
         """Get list of active missions for synergy analysis."""
         from src.domain.models import MissionStatus, Mission, Objective
 
+        # Reuse the previous conversion while missions are unchanged
+        rev = self.mission_manager.revision
+        if rev == self._active_missions_rev and self._active_missions_cache is not None:
+            return self._active_missions_cache
+
         # Get missions with "active" status (as string)
         mission_dicts = self.mission_manager.get_missions(status="active")
 
-        # Convert dictionaries to Mission objects for synergy analysis
+        # Convert dictionaries to Mission objects for synergy analysis.
+        # Fast path: stored missions normally carry every field, so convert
+        # them all at once with itemgetter and a single try block.
+        try:
+            missions = []
+            for m_dict in mission_dicts:
+                m_id, availability, timestamp, status = _MISSION_FIELDS(m_dict)
+                missions.append(Mission(
+                    id=m_id,
+                    reward=float(m_dict.get('reward') or 0),
+                    availability=availability,
+                    objectives=[Objective(*_OBJECTIVE_FIELDS(obj)) for obj in m_dict['objectives']],
+                    timestamp=timestamp,
+                    status=status
+                ))
+        except Exception:
+            missions = self._convert_missions_lenient(mission_dicts)
+
+        self._active_missions_cache = missions
+        self._active_missions_rev = rev
+        return missions
+
+    @staticmethod
+    def _convert_missions_lenient(mission_dicts):
+        """Convert mission dicts one by one with defaults, skipping bad ones."""
+        from src.domain.models import Mission, Objective
+
         missions = []
         for m_dict in mission_dicts:
             try:
@@ -230,7 +333,7 @@ class MainWindow(QMainWindow):
 
                 mission = Mission(
                     id=m_dict.get('id', ''),
-                    reward=float(m_dict.get('reward', 0)),
+                    reward=float(m_dict.get('reward') or 0),
                     availability=m_dict.get('availability', '00:00:00'),
                     objectives=objectives,
                     timestamp=m_dict.get('timestamp', ''),
@@ -282,7 +385,8 @@ class MainWindow(QMainWindow):
         # Reinitialize API client with new config
         self.api_client = APIClient(self.config)
         self.capture_tab.api_client = self.api_client
-        self.screenshot_parser_tab.api_client = self.api_client
+        if self.screenshot_parser_tab is not None:
+            self.screenshot_parser_tab.api_client = self.api_client
 
         # Reload route planner config (ship, algorithm, etc.)
         self.route_planner_tab.reload_config()
@@ -301,24 +405,25 @@ class MainWindow(QMainWindow):
         """Handle Discord login request."""
         self.status_bar.showMessage("Opening Discord login...", 3000)
 
-        import threading
+        # Run login on the background executor to not block UI
+        self._executor.submit(self._do_discord_login)
 
-        def do_login():
-            try:
-                result = self.discord_auth.start_login_flow()
-                # Emit signal to update UI on main thread
-                self._login_complete_signal.emit(
-                    result.get("success", False),
-                    result.get("message", result.get("error", "Unknown error"))
-                )
-            except Exception as e:
-                logger.error(f"Error in login thread: {e}")
+    def _do_discord_login(self):
+        """Run the blocking Discord login flow (executor thread)."""
+        try:
+            result = self.discord_auth.start_login_flow()
+            if self._closing:
+                return  # Window is gone; nothing left to update
+            # Emit signal to update UI on main thread
+            self._login_complete_signal.emit(
+                result.get("success", False),
+                result.get("message", result.get("error", "Unknown error"))
+            )
+        except Exception as e:
+            logger.error(f"Error in login thread: {e}")
+            if not self._closing:
                 self._login_complete_signal.emit(False, str(e))
 
-        # Start login in background thread to not block UI
-        login_thread = threading.Thread(target=do_login, daemon=True)
-        login_thread.start()
-
     def _on_discord_login_complete(self, success: bool, message: str):
         """Handle Discord login completion."""
         self.config_tab.on_discord_login_complete(success, message)
@@ -396,26 +501,23 @@ class MainWindow(QMainWindow):
             logger.info("Global hotkeys disabled in configuration")
             return
 
-        # Capture hotkey
-        capture_config = hotkey_config.get("capture", {})
-        if capture_config:
-            self.hotkey_manager.register(
-                name="capture",
-                modifiers=capture_config.get("modifiers", []),
-                key=capture_config.get("key", ""),
-                callback=self._hotkey_capture,
-                description=capture_config.get("description", "Capture mission")
-            )
+        # (config name, callback, default description) for each hotkey
+        hotkeys = (
+            ("capture", self._hotkey_capture, "Capture mission"),
+            ("save", self._hotkey_save, "Save mission"),
+        )
 
-        # Save hotkey
-        save_config = hotkey_config.get("save", {})
-        if save_config:
-            self.hotkey_manager.register(
-                name="save",
-                modifiers=save_config.get("modifiers", []),
-                key=save_config.get("key", ""),
-                callback=self._hotkey_save,
-                description=save_config.get("description", "Save mission")
+        register = self.hotkey_manager.register
+        for name, callback, default_description in hotkeys:
+            hotkey = hotkey_config.get(name)
+            if not hotkey:
+                continue
+            register(
+                name=name,
+                modifiers=hotkey.get("modifiers", ()),
+                key=hotkey.get("key", ""),
+                callback=callback,
+                description=hotkey.get("description", default_description)
             )
 
         # Start listening
@@ -459,6 +561,16 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'hotkey_manager'):
             self.hotkey_manager.stop()
 
+        # Abort a login still waiting for the browser so its executor thread
+        # exits, and drop queued background work
+        self._closing = True
+        self.discord_auth.cancel_login()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+        # Route finder keeps a persistent worker thread once created
+        if self.route_finder_tab is not None:
+            self.route_finder_tab.shutdown()
+
         self._save_geometry()
         logger.info("Application closing")
         event.accept()
@@ -12,6 +12,12 @@ from src.logger import get_logger
 
 logger = get_logger()
 
+# Padding around the selection and its dimensions label when invalidating, so
+# the 2 px border pen and antialiased text edges are repainted too.
+_DIRTY_MARGIN = 4
+
+_LEFT_BUTTON = Qt.MouseButton.LeftButton
+
 
 class RegionSelector(QWidget):
     """Fullscreen overlay for drag-to-select region."""
@@ -25,6 +31,7 @@ class RegionSelector(QWidget):
         self.start_point = None
         self.end_point = None
         self.is_selecting = False
+        self._last_dirty = QRect()
 
         self._setup_ui()
 
@@ -39,6 +46,12 @@ class RegionSelector(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setCursor(Qt.CursorShape.CrossCursor)
 
+        # Painter resources reused on every repaint
+        self._border_pen = QPen(QColor(0, 120, 212), 2)
+        self._text_color = QColor(255, 255, 255)
+        self._overlay_color = QColor(0, 0, 0, 100)
+        self._dim_offset = QPoint(-80, 20)
+
         # Cover all screens
         screen_geometry = QApplication.primaryScreen().geometry()
         self.setGeometry(screen_geometry)
@@ -57,30 +70,56 @@ class RegionSelector(QWidget):
 
     def mousePressEvent(self, event: QMouseEvent):
         """Handle mouse press to start selection."""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.start_point = event.pos()
-            self.end_point = event.pos()
+        if event.button() == _LEFT_BUTTON:
+            pos = event.pos()
+            self.start_point = pos
+            self.end_point = pos
             self.is_selecting = True
-            self.update()
+            self._last_dirty = self._dirty_rect(self._selection_rect())
+            self.update(self._last_dirty)
 
     def mouseMoveEvent(self, event: QMouseEvent):
         """Handle mouse move to update selection."""
         if self.is_selecting:
             self.end_point = event.pos()
-            self.update()
+            # Only repaint the area covered by the old and new selection
+            dirty = self._dirty_rect(self._selection_rect())
+            self.update(self._last_dirty.united(dirty))
+            self._last_dirty = dirty
+
+    def _selection_rect(self) -> QRect:
+        """Get the rectangle spanned by the current drag."""
+        sx, sy = self.start_point.x(), self.start_point.y()
+        ex, ey = self.end_point.x(), self.end_point.y()
+        return QRect(min(sx, ex), min(sy, ey), abs(ex - sx), abs(ey - sy))
+
+    @staticmethod
+    def _dimensions_text(rect: QRect) -> str:
+        """Format the size label drawn with the selection."""
+        return f"{rect.width()} × {rect.height()}"
+
+    def _dirty_rect(self, rect: QRect) -> QRect:
+        """Cover a selection rect's border and its dimensions label."""
+        # The label is anchored left of the bottom-right corner and can extend
+        # past the selection on any side of a narrow or short drag
+        label = self.fontMetrics().boundingRect(self._dimensions_text(rect))
+        label.translate(rect.bottomRight() + self._dim_offset)
+        return rect.united(label).adjusted(-_DIRTY_MARGIN, -_DIRTY_MARGIN, _DIRTY_MARGIN, _DIRTY_MARGIN)
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         """Handle mouse release to complete selection."""
-        if event.button() == Qt.MouseButton.LeftButton and self.is_selecting:
-            self.end_point = event.pos()
+        if event.button() == _LEFT_BUTTON and self.is_selecting:
+            end_point = event.pos()
+            self.end_point = end_point
             self.is_selecting = False
 
             # Calculate selection bounds
-            if self.start_point and self.end_point:
-                x1 = min(self.start_point.x(), self.end_point.x())
-                y1 = min(self.start_point.y(), self.end_point.y())
-                x2 = max(self.start_point.x(), self.end_point.x())
-                y2 = max(self.start_point.y(), self.end_point.y())
+            start_point = self.start_point
+            if start_point:
+                sx, sy = start_point.x(), start_point.y()
+                ex, ey = end_point.x(), end_point.y()
+                x1, x2 = min(sx, ex), max(sx, ex)
+                y1, y2 = min(sy, ey), max(sy, ey)
 
                 width = x2 - x1
                 height = y2 - y1
@@ -102,18 +141,14 @@ class RegionSelector(QWidget):
         """Draw the selection rectangle."""
         painter = QPainter(self)
 
-        # Draw semi-transparent overlay
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 100))
+        # Draw semi-transparent overlay (only over the invalidated area)
+        painter.fillRect(event.rect(), self._overlay_color)
 
         # Draw selection rectangle if selecting
-        if self.is_selecting and self.start_point and self.end_point:
-            # Calculate rectangle
-            x = min(self.start_point.x(), self.end_point.x())
-            y = min(self.start_point.y(), self.end_point.y())
-            width = abs(self.end_point.x() - self.start_point.x())
-            height = abs(self.end_point.y() - self.start_point.y())
-
-            rect = QRect(x, y, width, height)
+        start_point = self.start_point
+        end_point = self.end_point
+        if self.is_selecting and start_point and end_point:
+            rect = self._selection_rect()
 
             # Clear the selected area
             painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
@@ -121,11 +156,9 @@ class RegionSelector(QWidget):
 
             # Draw border
             painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
-            pen = QPen(QColor(0, 120, 212), 2)
-            painter.setPen(pen)
+            painter.setPen(self._border_pen)
             painter.drawRect(rect)
 
             # Draw dimensions text
-            painter.setPen(QColor(255, 255, 255))
-            dim_text = f"{width} × {height}"
-            painter.drawText(rect.bottomRight() + QPoint(-80, 20), dim_text)
+            painter.setPen(self._text_color)
+            painter.drawText(rect.bottomRight() + self._dim_offset, self._dimensions_text(rect))
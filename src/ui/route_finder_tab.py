@@ -6,23 +6,27 @@ and optimization goals.
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel,
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox, QLabel,
     QPushButton, QSpinBox, QComboBox, QCheckBox, QLineEdit,
     QTreeWidget, QTreeWidgetItem, QHeaderView, QCompleter,
     QSplitter, QFrame, QProgressBar, QSlider,
     QApplication, QScrollArea
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import (
+    Qt, QEvent, QObject, QThread, QTimer, pyqtSignal, pyqtSlot, QSignalBlocker, QStringListModel
+)
+from PyQt6.QtGui import QBrush, QColor, QStandardItemModel, QStandardItem
 
-from typing import Optional, List, TYPE_CHECKING
+from collections import OrderedDict, deque
+from functools import cached_property, lru_cache
+from typing import Deque, Dict, Iterable, Iterator, NamedTuple, Optional, List, Tuple, Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.sync_service import SyncService
 
 from src.mission_scan_db import MissionScanDB, CONTRACTOR_CANONICAL
 from src.config import Config
-from src.location_autocomplete import LocationMatcher
+from src.location_autocomplete import LocationMatcher, LocationTrie
 from src.ship_profiles import ShipManager, SHIP_PROFILES
 from src.services.route_finder_service import (
     RouteFinderService, RouteFinderFilters, OptimizationGoal,
@@ -34,12 +38,60 @@ from src.logger import get_logger
 
 logger = get_logger()
 
+# Item data role holding the raw numeric value of a formatted results cell
+SORT_KEY_ROLE = Qt.ItemDataRole.UserRole + 100
+
+# Item data role flagging a route row whose details have been built
+POPULATED_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# Item data role holding a route row's pre-formatted detail rows
+DETAILS_ROLE = Qt.ItemDataRole.UserRole + 2
+
+# Results columns sized to their contents (Reward, Stops, SCU, Missions, Score)
+_FITTED_COLUMNS = (1, 2, 3, 4, 5)
+
+# Shared brushes for result highlighting (Qt brushes are implicitly shared)
+_TOP_ROUTE_BRUSH = QBrush(QColor(76, 175, 80, 50))  # Green tint
+_PICKUP_BRUSH = QBrush(QColor(76, 175, 80))  # Green
+_DELIVERY_BRUSH = QBrush(QColor(244, 67, 54))  # Red
+_CARGO_BRUSH = QBrush(QColor(158, 158, 158))  # Gray
+
+# Location type groups are fixed, so build them once
+_ALL_LOC_TYPES = tuple(LocationType.all_types())
+_SPACE_TYPES = frozenset(LocationType.space_only_types())
+_GROUND_TYPES = frozenset(LocationType.ground_types())
+
+# Ship profiles are static, so sort them by capacity once
+_SHIPS_BY_CAPACITY = sorted(SHIP_PROFILES.items(), key=lambda x: x[1].cargo_capacity_scu)
+
+# Most routes kept in the results list; older ones drop off as "More" is used
+_MAX_ROUTES = 500
+
+# Number of recent searches whose results are kept for instant replay
+_RESULT_CACHE_SIZE = 32
+
+# Default results sort (column, order) for each dominant optimization goal
+# Columns: 0=Route, 1=Reward, 2=Stops, 3=SCU, 4=Missions, 5=Score
+_GOAL_SORT = {
+    OptimizationGoal.MAX_REWARD: (1, Qt.SortOrder.DescendingOrder),
+    OptimizationGoal.FEWEST_STOPS: (2, Qt.SortOrder.AscendingOrder),
+    OptimizationGoal.MIN_DISTANCE: (5, Qt.SortOrder.DescendingOrder),
+    OptimizationGoal.BEST_REWARD_PER_STOP: (5, Qt.SortOrder.DescendingOrder),
+    OptimizationGoal.BEST_REWARD_PER_SCU: (5, Qt.SortOrder.DescendingOrder),
+}
+
+# Detail rows created per event-loop tick when a route row is expanded
+_DETAIL_BATCH_SIZE = 25
+
+# Longest the app waits on close for a running search to reach a stop check
+_SHUTDOWN_TIMEOUT_MS = 3000
+
 
 class SortableTreeWidgetItem(QTreeWidgetItem):
     """Tree widget item with proper numeric sorting for route columns."""
 
     # Column indices that should be sorted numerically
-    NUMERIC_COLUMNS = {1, 2, 3, 4, 5}  # Reward, Stops, SCU, Missions, Score
+    NUMERIC_COLUMNS = frozenset({1, 2, 3, 4, 5})  # Reward, Stops, SCU, Missions, Score
 
     def __lt__(self, other: QTreeWidgetItem) -> bool:
         """Compare items for sorting."""
@@ -50,37 +102,32 @@ class SortableTreeWidgetItem(QTreeWidgetItem):
         col = tree.sortColumn()
 
         if col in self.NUMERIC_COLUMNS:
-            # Extract numeric value from text (remove formatting like commas, aUEC, etc.)
-            self_val = self._extract_number(self.text(col))
-            other_val = self._extract_number(other.text(col))
-            return self_val < other_val
+            # Compare the raw values stored alongside the formatted text
+            self_val = self.data(col, SORT_KEY_ROLE)
+            other_val = other.data(col, SORT_KEY_ROLE)
+            if self_val is not None and other_val is not None:
+                return self_val < other_val
 
         return super().__lt__(other)
 
-    def _extract_number(self, text: str) -> float:
-        """Extract numeric value from formatted text."""
-        # Remove common suffixes and formatting
-        cleaned = text.replace(",", "").replace(" aUEC", "").replace(" SCU", "").strip()
-        try:
-            return float(cleaned)
-        except ValueError:
-            return 0.0
-
 
 class StopTreeWidgetItem(QTreeWidgetItem):
     """Tree widget item for stops with numeric prefix sorting."""
 
     def __lt__(self, other: QTreeWidgetItem) -> bool:
-        """Compare items by extracting numeric prefix (e.g., '5. Location')."""
+        """Compare items by stop number (e.g., '5. Location')."""
         tree = self.treeWidget()
         if not tree:
             return super().__lt__(other)
 
-        col = tree.sortColumn()
-        if col == 0:
-            # Extract leading number from "N. Location" format
-            self_num = self._extract_prefix_number(self.text(0))
-            other_num = self._extract_prefix_number(other.text(0))
+        if tree.sortColumn() == 0:
+            # Stop number stored at creation, parsed from "N. Location" otherwise
+            self_num = self.data(0, SORT_KEY_ROLE)
+            if self_num is None:
+                self_num = self._extract_prefix_number(self.text(0))
+            other_num = other.data(0, SORT_KEY_ROLE)
+            if other_num is None:
+                other_num = self._extract_prefix_number(other.text(0))
             if self_num is not None and other_num is not None:
                 return self_num < other_num
 
@@ -97,41 +144,163 @@ class StopTreeWidgetItem(QTreeWidgetItem):
         return None
 
 
-class RouteFinderWorker(QThread):
-    """Background worker for route finding."""
+class DetailRow(NamedTuple):
+    """A pre-formatted row of an expanded route's details."""
+
+    depth: int  # 0 = section header, 1 = stop/mission/metric, 2 = detail line
+    text: str
+    foreground: Optional[QBrush] = None
+    item_type: Type[QTreeWidgetItem] = QTreeWidgetItem
+    expanded: bool = False
+    sort_key: Optional[int] = None  # Column 0 SORT_KEY_ROLE value
+
+
+# A prepared results row: (column texts, sort keys for _FITTED_COLUMNS, candidate, detail rows)
+RouteRow = Tuple[Tuple[str, ...], Tuple[float, ...], CandidateRoute, Tuple[DetailRow, ...]]
+
+
+@lru_cache(maxsize=4096)
+def _format_auec(amount: float) -> str:
+    """Format a whole aUEC amount with digit grouping (cached; rewards repeat a lot)."""
+    return f"{amount:,.0f} aUEC"
+
+
+@lru_cache(maxsize=4096)
+def _format_mission_label(rank: str, reward: float) -> str:
+    """Format a mission row label, prefixed with its rank if it has one."""
+    if rank:
+        return f"[{rank}] {_format_auec(reward)}"
+    return _format_auec(reward)
+
+
+def _format_mission_rows(mission_scan: dict) -> Tuple[DetailRow, ...]:
+    """Format a mission's label row followed by its objective rows."""
+    mission_data = mission_scan.get("mission_data", {})
+    label = _format_mission_label(mission_data.get("rank", ""), mission_data.get("reward", 0))
+
+    rows = [DetailRow(1, label)]
+    for obj in mission_data.get("objectives", []):
+        rows.append(DetailRow(
+            2,
+            f"    {obj.get('scu_amount', 0)} SCU: "
+            f"{obj.get('collect_from', '?')} -> {obj.get('deliver_to', '?')}"
+        ))
+    return tuple(rows)
+
+
+def _format_route_details(
+    candidate: CandidateRoute,
+    mission_rows: Dict[int, Tuple[DetailRow, ...]]
+) -> Tuple[DetailRow, ...]:
+    """
+    Format the stops, missions and metrics sections of a route, depth-first.
+
+    mission_rows caches formatted missions by id(); it must be cleared
+    whenever the scan database reloads or changes its mission dicts.
+    """
+    rows = [DetailRow(0, "== STOPS ==", expanded=True)]
+
+    for stop in candidate.route.stops:
+        rows.append(DetailRow(
+            1, f"{stop.stop_number}. {stop.location}",
+            item_type=StopTreeWidgetItem, sort_key=stop.stop_number
+        ))
+        for obj in stop.pickups:
+            rows.append(DetailRow(2, f"    [+] LOAD: {obj.scu_amount} SCU {obj.cargo_type}", _PICKUP_BRUSH))
+        for obj in stop.deliveries:
+            rows.append(DetailRow(2, f"    [-] DELIVER: {obj.scu_amount} SCU {obj.cargo_type}", _DELIVERY_BRUSH))
+        rows.append(DetailRow(2, f"    Cargo: {stop.cargo_before} -> {stop.cargo_after} SCU", _CARGO_BRUSH))
+
+    rows.append(DetailRow(0, f"== MISSIONS ({len(candidate.missions)}) =="))
 
-    finished = pyqtSignal(list, int)  # List[CandidateRoute], pool_size
+    for mission_scan in candidate.missions:
+        # Candidates share missions, so each mission's rows are formatted once
+        key = id(mission_scan)
+        if key not in mission_rows:
+            mission_rows[key] = _format_mission_rows(mission_scan)
+        rows += mission_rows[key]
+
+    rows.append(DetailRow(0, "== METRICS =="))
+
+    rows += [DetailRow(1, line) for line in candidate.metrics.detail_lines]
+
+    return tuple(rows)
+
+
+def _make_detail_item(parent: QTreeWidgetItem, row: DetailRow) -> QTreeWidgetItem:
+    """Create a spanned detail item under an attached parent."""
+    item = row.item_type(parent, [row.text])
+    if row.foreground is not None:
+        item.setForeground(0, row.foreground)
+    if row.sort_key is not None:
+        item.setData(0, SORT_KEY_ROLE, row.sort_key)
+    item.setFirstColumnSpanned(True)
+    if row.expanded:
+        item.setExpanded(True)
+    return item
+
+
+class RouteFinderWorker(QObject):
+    """Background worker for route finding, living on a persistent thread."""
+
+    finished = pyqtSignal(list, int)  # List[RouteRow], pool_size
     error = pyqtSignal(str)
     progress = pyqtSignal(str)
 
-    def __init__(
+    def __init__(self, service: RouteFinderService):
+        super().__init__()
+        self.service = service
+        # Formatted mission rows, valid for one scan database revision
+        self._mission_rows: Dict[int, Tuple[DetailRow, ...]] = {}
+        self._mission_rows_revision = -1
+
+    @pyqtSlot(object, object, object, int, int)
+    def do_search(
         self,
-        service: RouteFinderService,
         filters: RouteFinderFilters,
         weights: OptimizationWeights,
-        strategy: SearchStrategy = SearchStrategy.FAST,
-        offset: int = 0,
-        max_results: int = 10
+        strategy: SearchStrategy,
+        offset: int,
+        max_results: int
     ):
-        super().__init__()
-        self.service = service
-        self.filters = filters
-        self.weights = weights
-        self.strategy = strategy
-        self.offset = offset
-        self.max_results = max_results
-
-    def run(self):
+        """Run one search and emit formatted result rows."""
         try:
+            # Checked before searching, so a change mid-search clears the cache next time
+            revision = self.service.scan_db.revision
+            if revision != self._mission_rows_revision:
+                self._mission_rows.clear()
+                self._mission_rows_revision = revision
+
             self.progress.emit("Filtering missions...")
             routes = self.service.find_best_routes(
-                self.filters, self.weights,
-                max_results=self.max_results,
-                strategy=self.strategy,
-                offset=self.offset
+                filters, weights,
+                max_results=max_results,
+                strategy=strategy,
+                offset=offset
             )
             pool_size = self.service.last_pool_size
-            self.finished.emit(routes, pool_size)
+
+            # Format the row text, sort keys and expanded details here so
+            # the GUI thread only builds items
+            mission_rows = self._mission_rows
+            rows = [
+                (
+                    (
+                        f"Route #{i}",
+                        _format_auec(m.total_reward),
+                        str(m.stop_count),
+                        str(m.total_scu),
+                        str(m.mission_count),
+                        f"{c.score:,.1f}",
+                    ),
+                    (m.total_reward, m.stop_count, m.total_scu, m.mission_count, c.score),
+                    c,
+                    _format_route_details(c, mission_rows),
+                )
+                for i, c in enumerate(routes, offset + 1)
+                for m in (c.metrics,)
+            ]
+            self.finished.emit(rows, pool_size)
         except Exception as e:
             logger.error(f"Route finder error: {e}")
             self.error.emit(str(e))
@@ -140,6 +309,9 @@ class RouteFinderWorker(QThread):
 class RouteFinderTab(QWidget):
     """Tab for finding optimal routes from mission scans."""
 
+    # filters, weights, strategy, offset, max_results -> RouteFinderWorker.do_search
+    _search_requested = pyqtSignal(object, object, object, int, int)
+
     def __init__(
         self,
         config: Config,
@@ -157,23 +329,58 @@ class RouteFinderTab(QWidget):
         self.sync_service = sync_service
         self.classifier = LocationTypeClassifier()
 
+        # One worker thread serves every search; requests are queued to it.
+        # Interrupting it (on shutdown) stops a running search between batches
+        self._worker_thread = QThread(self)
         self.service = RouteFinderService(
             scan_db=scan_db,
             location_classifier=self.classifier,
             ship_manager=self.ship_manager,
-            config=config
+            config=config,
+            should_stop=self._worker_thread.isInterruptionRequested
         )
 
-        self._worker: Optional[RouteFinderWorker] = None
-        self._current_routes: List[CandidateRoute] = []
+        self._worker = RouteFinderWorker(self.service)
+        self._worker.moveToThread(self._worker_thread)
+        self._worker_thread.finished.connect(self._worker.deleteLater)
+        self._search_requested.connect(self._worker.do_search, Qt.ConnectionType.QueuedConnection)
+        self._worker.finished.connect(self._on_worker_finished)
+        self._worker.error.connect(self._on_worker_error)
+        self._worker.progress.connect(self._on_progress)
+        self._worker_thread.start()
+        self._search_running = False
+        self._search_handler = None
+        self._current_routes: Deque[RouteRow] = deque(maxlen=_MAX_ROUTES)
         self._last_filters: Optional[RouteFinderFilters] = None
         self._last_weights: Optional[OptimizationWeights] = None
         self._last_strategy: Optional[SearchStrategy] = None
         self._route_offset: int = 0
         self._last_pool_size: int = 0
+        self._total_missions: int = 0  # Missions used across _current_routes
+
+        # Rebuilt only after a filter/weight widget changes
+        self._filters_cache: Optional[RouteFinderFilters] = None
+        self._weights_cache: Optional[OptimizationWeights] = None
+        # Search key -> (routes, pool_size), least recently used first
+        self._result_cache: "OrderedDict[tuple, Tuple[List[RouteRow], int]]" = OrderedDict()
+        self._worker_key: Optional[tuple] = None
+
+        # Coalesces bursts of refresh() calls into one reload
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._load_initial_data)
+
+        # Expanded route rows still being filled in, keyed by id(item)
+        self._pending_details: Dict[int, Iterator[None]] = {}
+        self._details_timer = QTimer(self)
+        self._details_timer.setInterval(0)
+        self._details_timer.timeout.connect(self._populate_next_detail_batch)
 
         self._setup_ui()
-        self._load_initial_data()
+        self._connect_cache_invalidation()
+        # Statistics load after the first paint; coalesces with the activation refresh
+        self.refresh()
 
     def _setup_ui(self):
         """Setup the route finder UI."""
@@ -210,11 +417,15 @@ class RouteFinderTab(QWidget):
         start_layout.addWidget(QLabel("Start From:"))
         self.start_location = QLineEdit()
         self.start_location.setPlaceholderText("Any location (optional)")
-        locations = self.location_matcher.get_scannable_locations()
-        completer = QCompleter(locations)
-        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        completer.setFilterMode(Qt.MatchFlag.MatchContains)
-        self.start_location.setCompleter(completer)
+        # Suggestions come from a substring trie; the completer only displays them.
+        # The trie is built when the field first gains focus (see eventFilter)
+        self._autocomplete_locus = None
+        self._location_model = QStringListModel(self)
+        self._location_completer = QCompleter(self._location_model, self)
+        self._location_completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.start_location.setCompleter(self._location_completer)
+        self.start_location.textEdited.connect(self._on_start_location_edited)
+        self.start_location.installEventFilter(self)
         start_layout.addWidget(self.start_location, 1)
         basic_layout.addLayout(start_layout)
 
@@ -252,15 +463,9 @@ class RouteFinderTab(QWidget):
         }
 
         # Default checked: space types
-        default_checked = [
-            LocationType.ORBITAL_STATION,
-            LocationType.LAGRANGE_STATION,
-            LocationType.DISTRIBUTION_CENTER,
-        ]
-
-        for loc_type in LocationType.all_types():
+        for loc_type in _ALL_LOC_TYPES:
             cb = QCheckBox(type_display_names.get(loc_type, loc_type))
-            cb.setChecked(loc_type in default_checked)
+            cb.setChecked(loc_type in _SPACE_TYPES)
             self.location_type_checks[loc_type] = cb
             loc_type_layout.addWidget(cb)
 
@@ -302,42 +507,42 @@ class RouteFinderTab(QWidget):
         # Store contractor widgets: {contractor_name: (checkbox, min_rank_combo, max_rank_combo)}
         self.contractor_widgets = {}
 
-        # Build dynamically from CONTRACTOR_CANONICAL
-        for contractor_name in sorted(CONTRACTOR_CANONICAL.keys()):
-            # Row for each contractor
-            row_layout = QHBoxLayout()
-            row_layout.setSpacing(4)
+        # One rank list model shared by every min/max rank combo
+        rank_model = QStandardItemModel(self)
+        for rank in ["Any"] + RANK_HIERARCHY:
+            rank_model.appendRow(QStandardItem(rank))
 
+        # One grid for all contractor rows instead of a layout per row
+        contractor_grid = QGridLayout()
+        contractor_grid.setSpacing(4)
+        contractor_grid.setColumnStretch(4, 1)
+        contractor_layout.addLayout(contractor_grid)
+
+        # Build dynamically from CONTRACTOR_CANONICAL
+        for row, contractor_name in enumerate(sorted(CONTRACTOR_CANONICAL.keys())):
             # Checkbox for contractor
             cb = QCheckBox(contractor_name)
             cb.setChecked(True)  # All contractors enabled by default
             cb.setMinimumWidth(140)
-            row_layout.addWidget(cb)
+            contractor_grid.addWidget(cb, row, 0)
 
             # Min rank
             min_rank = QComboBox()
             min_rank.setFixedWidth(90)
-            min_rank.addItem("Any")
-            for rank in RANK_HIERARCHY:
-                min_rank.addItem(rank)
-            row_layout.addWidget(min_rank)
+            min_rank.setModel(rank_model)
+            contractor_grid.addWidget(min_rank, row, 1)
 
             # "to" label
             to_label = QLabel("-")
             to_label.setFixedWidth(15)
             to_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            row_layout.addWidget(to_label)
+            contractor_grid.addWidget(to_label, row, 2)
 
             # Max rank
             max_rank = QComboBox()
             max_rank.setFixedWidth(90)
-            max_rank.addItem("Any")
-            for rank in RANK_HIERARCHY:
-                max_rank.addItem(rank)
-            row_layout.addWidget(max_rank)
-
-            row_layout.addStretch()
-            contractor_layout.addLayout(row_layout)
+            max_rank.setModel(rank_model)
+            contractor_grid.addWidget(max_rank, row, 3)
 
             # Store references
             self.contractor_widgets[contractor_name] = (cb, min_rank, max_rank)
@@ -389,13 +594,13 @@ class RouteFinderTab(QWidget):
         ship_layout = QVBoxLayout()
 
         self.ship_combo = QComboBox()
-        # Populate ships sorted by capacity
-        ships = sorted(SHIP_PROFILES.items(), key=lambda x: x[1].cargo_capacity_scu)
-        for key, profile in ships:
-            self.ship_combo.addItem(
-                f"{profile.name} ({profile.cargo_capacity_scu} SCU)",
-                key
-            )
+        # Populate ships sorted by capacity in a single model assignment
+        ship_model = QStandardItemModel(self.ship_combo)
+        for key, profile in _SHIPS_BY_CAPACITY:
+            ship_item = QStandardItem(f"{profile.name} ({profile.cargo_capacity_scu} SCU)")
+            ship_item.setData(key, Qt.ItemDataRole.UserRole)
+            ship_model.appendRow(ship_item)
+        self.ship_combo.setModel(ship_model)
         # Default to Zeus CL if available
         zeus_idx = self.ship_combo.findData("RSI_ZEUS_MK2_CL")
         if zeus_idx >= 0:
@@ -455,7 +660,6 @@ class RouteFinderTab(QWidget):
             slider.setRange(0, 100)
             slider.setValue(default_val)
             slider.setTickPosition(QSlider.TickPosition.NoTicks)
-            slider.valueChanged.connect(self._on_weight_changed)
             self.weight_sliders[goal] = slider
             row.addWidget(slider, 1)
 
@@ -465,6 +669,9 @@ class RouteFinderTab(QWidget):
             self.weight_labels[goal] = value_label
             row.addWidget(value_label)
 
+            # Only the moved slider's label needs updating
+            slider.valueChanged.connect(lambda v, lbl=value_label: lbl.setText(f"{v}%"))
+
             goal_layout.addLayout(row)
 
         # Preset buttons
@@ -534,16 +741,16 @@ class RouteFinderTab(QWidget):
         ])
         self.results_tree.setAlternatingRowColors(True)
         self.results_tree.setRootIsDecorated(True)
+        # Every row is a single line of text, so the view can skip per-row size hints
+        self.results_tree.setUniformRowHeights(True)
         self.results_tree.setSortingEnabled(True)
         self.results_tree.itemExpanded.connect(self._on_item_expanded)
+        self.results_tree.itemCollapsed.connect(self._on_item_collapsed)
 
         header = self.results_tree.header()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
+        for col in _FITTED_COLUMNS:
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
 
         right_layout.addWidget(self.results_tree, 1)
 
@@ -567,22 +774,89 @@ class RouteFinderTab(QWidget):
             f"{stats['unique_locations']} locations"
         )
 
+    def _connect_cache_invalidation(self):
+        """Drop cached filters/weights whenever an input widget changes."""
+        self.start_location.textChanged.connect(self._invalidate_filters)
+        self.max_stops.valueChanged.connect(self._invalidate_filters)
+        self.round_trip.toggled.connect(self._invalidate_filters)
+        for cb in self.location_type_checks.values():
+            cb.toggled.connect(self._invalidate_filters)
+        for cb in self.system_checks.values():
+            cb.toggled.connect(self._invalidate_filters)
+        for cb, min_rank, max_rank in self.contractor_widgets.values():
+            cb.toggled.connect(self._invalidate_filters)
+            min_rank.currentIndexChanged.connect(self._invalidate_filters)
+            max_rank.currentIndexChanged.connect(self._invalidate_filters)
+        self.min_reward.valueChanged.connect(self._invalidate_filters)
+        self.max_reward.valueChanged.connect(self._invalidate_filters)
+        self.ship_combo.currentIndexChanged.connect(self._invalidate_filters)
+        for slider in self.weight_sliders.values():
+            slider.valueChanged.connect(self._invalidate_weights)
+
+    def _invalidate_filters(self, *args):
+        """Mark cached filters as stale."""
+        self._filters_cache = None
+
+    def _invalidate_weights(self, *args):
+        """Mark cached weights as stale."""
+        self._weights_cache = None
+
+    @cached_property
+    def _location_trie(self) -> LocationTrie:
+        """Substring index over scannable locations, built on first use."""
+        return LocationTrie(self.location_matcher.get_scannable_locations())
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        """Build the location trie when the start field first gains focus."""
+        if obj is self.start_location and event.type() == QEvent.Type.FocusIn:
+            self._location_trie  # Built once, ahead of the first keystroke
+            self.start_location.removeEventFilter(self)
+        return super().eventFilter(obj, event)
+
+    def _on_start_location_edited(self, text: str):
+        """Update start location suggestions from the trie."""
+        query = text.strip().lower()
+        prev_query, prev_node = self._autocomplete_locus or ("", self._location_trie.root)
+
+        # Extending the previous query continues from its node instead of the root
+        if query.startswith(prev_query):
+            node = prev_node and self._location_trie.descend(prev_node, query[len(prev_query):])
+        else:
+            node = self._location_trie.descend(self._location_trie.root, query)
+        self._autocomplete_locus = (query, node)
+
+        if not query:
+            self._location_completer.popup().hide()
+            return
+
+        self._location_model.setStringList(self._location_trie.names_for(node))
+        if self._location_model.rowCount():
+            self._location_completer.complete()
+        else:
+            self._location_completer.popup().hide()
+
+    def _set_checked_silently(self, states: Iterable[Tuple[QCheckBox, bool]]):
+        """Set many checkboxes without per-box signals, then invalidate filters once."""
+        for cb, checked in states:
+            with QSignalBlocker(cb):
+                cb.setChecked(checked)
+        self._invalidate_filters()
+
     def _set_all_location_types(self, checked: bool):
         """Set all location type checkboxes."""
-        for cb in self.location_type_checks.values():
-            cb.setChecked(checked)
+        self._set_checked_silently((cb, checked) for cb in self.location_type_checks.values())
 
     def _set_space_only(self):
         """Set only space location types."""
-        space_types = LocationType.space_only_types()
-        for loc_type, cb in self.location_type_checks.items():
-            cb.setChecked(loc_type in space_types)
+        self._set_checked_silently(
+            (cb, loc_type in _SPACE_TYPES) for loc_type, cb in self.location_type_checks.items()
+        )
 
     def _set_ground_only(self):
         """Set only ground location types."""
-        ground_types = LocationType.ground_types()
-        for loc_type, cb in self.location_type_checks.items():
-            cb.setChecked(loc_type in ground_types)
+        self._set_checked_silently(
+            (cb, loc_type in _GROUND_TYPES) for loc_type, cb in self.location_type_checks.items()
+        )
 
     def _on_contractor_toggled(self, checked: bool, min_rank: QComboBox, max_rank: QComboBox):
         """Handle contractor checkbox toggle - enable/disable rank combos."""
@@ -591,8 +865,10 @@ class RouteFinderTab(QWidget):
 
     def _set_all_contractors(self, checked: bool):
         """Set all contractor checkboxes."""
+        self._set_checked_silently((cb, checked) for cb, _, _ in self.contractor_widgets.values())
+        # Toggled handlers were blocked, so sync the rank combos here
         for cb, min_rank, max_rank in self.contractor_widgets.values():
-            cb.setChecked(checked)
+            self._on_contractor_toggled(checked, min_rank, max_rank)
 
     def _clear_filters(self):
         """Reset filters to defaults."""
@@ -600,15 +876,16 @@ class RouteFinderTab(QWidget):
         self.max_stops.setValue(50)
         self.round_trip.setChecked(False)
         self._set_space_only()
-        for cb in self.system_checks.values():
-            cb.setChecked(False)
-        self.system_checks["Stanton"].setChecked(True)
+        self._set_checked_silently(
+            (cb, system == "Stanton") for system, cb in self.system_checks.items()
+        )
 
         # Reset contractor filters
+        self._set_all_contractors(True)
         for cb, min_rank, max_rank in self.contractor_widgets.values():
-            cb.setChecked(True)
-            min_rank.setCurrentIndex(0)  # "Any"
-            max_rank.setCurrentIndex(0)  # "Any"
+            with QSignalBlocker(min_rank), QSignalBlocker(max_rank):
+                min_rank.setCurrentIndex(0)  # "Any"
+                max_rank.setCurrentIndex(0)  # "Any"
 
         self.min_reward.setValue(0)
         self.max_reward.setValue(0)
@@ -618,17 +895,23 @@ class RouteFinderTab(QWidget):
 
     def _get_filters(self) -> RouteFinderFilters:
         """Get current filter settings."""
+        if self._filters_cache is None:
+            self._filters_cache = self._build_filters()
+        return self._filters_cache
+
+    def _build_filters(self) -> RouteFinderFilters:
+        """Build filter settings from the input widgets."""
         # Get allowed location types
-        allowed_types = [
+        allowed_types = tuple(
             loc_type for loc_type, cb in self.location_type_checks.items()
             if cb.isChecked()
-        ]
+        )
 
         # Get allowed systems
-        allowed_systems = [
+        allowed_systems = tuple(
             system for system, cb in self.system_checks.items()
             if cb.isChecked()
-        ]
+        )
 
         # Get contractor filters (only checked contractors with their rank requirements)
         contractor_filters = {}
@@ -649,6 +932,8 @@ class RouteFinderTab(QWidget):
             )
             if all_any:
                 contractor_filters = None
+        if contractor_filters is not None:
+            contractor_filters = tuple(contractor_filters.items())
 
         # Get reward range
         min_reward = self.min_reward.value() if self.min_reward.value() > 0 else None
@@ -672,25 +957,36 @@ class RouteFinderTab(QWidget):
             contractor_filters=contractor_filters
         )
 
-    def _on_weight_changed(self):
-        """Update weight label when slider moves."""
-        for goal, slider in self.weight_sliders.items():
-            self.weight_labels[goal].setText(f"{slider.value()}%")
-
     def _apply_preset(self, preset_name: str):
         """Apply a preset weight configuration."""
         preset = OPTIMIZATION_PRESETS.get(preset_name)
         if not preset:
             return
 
-        self.weight_sliders[OptimizationGoal.MAX_REWARD].setValue(preset.max_reward)
-        self.weight_sliders[OptimizationGoal.FEWEST_STOPS].setValue(preset.fewest_stops)
-        self.weight_sliders[OptimizationGoal.MIN_DISTANCE].setValue(preset.min_distance)
-        self.weight_sliders[OptimizationGoal.BEST_REWARD_PER_STOP].setValue(preset.reward_per_stop)
-        self.weight_sliders[OptimizationGoal.BEST_REWARD_PER_SCU].setValue(preset.reward_per_scu)
+        values = {
+            OptimizationGoal.MAX_REWARD: preset.max_reward,
+            OptimizationGoal.FEWEST_STOPS: preset.fewest_stops,
+            OptimizationGoal.MIN_DISTANCE: preset.min_distance,
+            OptimizationGoal.BEST_REWARD_PER_STOP: preset.reward_per_stop,
+            OptimizationGoal.BEST_REWARD_PER_SCU: preset.reward_per_scu,
+        }
+
+        # Set all sliders silently, then refresh labels and cached weights once
+        for goal, value in values.items():
+            slider = self.weight_sliders[goal]
+            with QSignalBlocker(slider):
+                slider.setValue(value)
+            self.weight_labels[goal].setText(f"{slider.value()}%")
+        self._invalidate_weights()
 
     def _get_weights(self) -> OptimizationWeights:
         """Get current optimization weights from sliders."""
+        if self._weights_cache is None:
+            self._weights_cache = self._build_weights()
+        return self._weights_cache
+
+    def _build_weights(self) -> OptimizationWeights:
+        """Build optimization weights from the slider values."""
         return OptimizationWeights(
             max_reward=self.weight_sliders[OptimizationGoal.MAX_REWARD].value(),
             fewest_stops=self.weight_sliders[OptimizationGoal.FEWEST_STOPS].value(),
@@ -705,7 +1001,7 @@ class RouteFinderTab(QWidget):
 
     def _find_routes(self):
         """Start route finding."""
-        if self._worker and self._worker.isRunning():
+        if self._search_running:
             return  # Already running
 
         filters = self._get_filters()
@@ -719,9 +1015,8 @@ class RouteFinderTab(QWidget):
         if not filters.allowed_systems:
             self.status_label.setText("Error: Select at least one system")
             return
-        # Check if at least one contractor is selected
-        any_contractor = any(cb.isChecked() for cb, _, _ in self.contractor_widgets.values())
-        if not any_contractor:
+        # Filters hold only checked contractors (None when all are allowed)
+        if filters.contractor_filters == ():
             self.status_label.setText("Error: Select at least one contractor")
             return
         if not weights.is_valid():
@@ -734,7 +1029,8 @@ class RouteFinderTab(QWidget):
         self._last_strategy = strategy
         self._route_offset = 0
         self._last_pool_size = 0
-        self._current_routes = []  # Clear previous results
+        self._current_routes.clear()  # Clear previous results
+        self._total_missions = 0
 
         # Start worker
         self.find_btn.setEnabled(False)
@@ -742,22 +1038,16 @@ class RouteFinderTab(QWidget):
         self.more_btn.hide()
         self.progress_bar.show()
         self.results_tree.clear()
+        self._cancel_detail_batches()
         self.results_label.setText("Searching for routes...")
 
-        self._worker = RouteFinderWorker(
-            self.service, filters, weights, strategy,
-            offset=0, max_results=10
-        )
-        self._worker.finished.connect(self._on_routes_found)
-        self._worker.error.connect(self._on_route_error)
-        self._worker.progress.connect(self._on_progress)
-        self._worker.start()
+        self._start_search(filters, weights, strategy, 0, self._on_routes_found)
 
     def _on_progress(self, message: str):
         """Handle progress updates."""
         self.status_label.setText(message)
 
-    def _on_routes_found(self, routes: List[CandidateRoute], pool_size: int):
+    def _on_routes_found(self, routes: List[RouteRow], pool_size: int):
         """Handle route finding completion."""
         self.find_btn.setEnabled(True)
         self.find_btn.setText("Find Routes")
@@ -766,8 +1056,10 @@ class RouteFinderTab(QWidget):
         self._current_routes.extend(routes)
         self._route_offset += len(routes)
         self._last_pool_size = pool_size
+        self._total_missions += sum(len(c.missions) for _, _, c, _ in routes)
 
         if not self._current_routes:
+            self._restore_sorting()
             self.results_label.setText("No routes found")
             self.status_label.setText("No routes match your criteria. Try adjusting filters.")
             self.more_btn.hide()
@@ -782,8 +1074,7 @@ class RouteFinderTab(QWidget):
         else:
             self.more_btn.hide()
 
-        total_missions = sum(len(r.missions) for r in self._current_routes)
-        self.status_label.setText(f"Found {len(self._current_routes)} routes from {pool_size} missions (using {total_missions})")
+        self.status_label.setText(f"Found {len(self._current_routes)} routes from {pool_size} missions (using {self._total_missions})")
 
     def _on_route_error(self, error: str):
         """Handle route finding error."""
@@ -791,12 +1082,13 @@ class RouteFinderTab(QWidget):
         self.find_btn.setText("Find Routes")
         self.progress_bar.hide()
         self.more_btn.hide()
+        self._restore_sorting()
         self.results_label.setText("Error finding routes")
         self.status_label.setText(f"Error: {error}")
 
     def _load_more_routes(self):
         """Load more routes using saved search state."""
-        if self._worker and self._worker.isRunning():
+        if self._search_running:
             return  # Already running
 
         if not self._last_filters or not self._last_weights:
@@ -808,16 +1100,80 @@ class RouteFinderTab(QWidget):
         self.progress_bar.show()
         self.status_label.setText("Loading more routes...")
 
-        self._worker = RouteFinderWorker(
-            self.service, self._last_filters, self._last_weights, self._last_strategy,
-            offset=self._route_offset, max_results=10
+        self._start_search(
+            self._last_filters, self._last_weights, self._last_strategy,
+            self._route_offset, self._on_more_routes_found
         )
-        self._worker.finished.connect(self._on_more_routes_found)
-        self._worker.error.connect(self._on_route_error)
-        self._worker.progress.connect(self._on_progress)
-        self._worker.start()
 
-    def _on_more_routes_found(self, routes: List[CandidateRoute], pool_size: int):
+    def _search_key(
+        self,
+        filters: RouteFinderFilters,
+        weights: OptimizationWeights,
+        strategy: SearchStrategy,
+        offset: int
+    ) -> tuple:
+        """Build a hashable key identifying a search and the scan data it ran on."""
+        return (
+            self.scan_db.revision,
+            filters,
+            weights,
+            strategy,
+            offset,
+        )
+
+    def _start_search(
+        self,
+        filters: RouteFinderFilters,
+        weights: OptimizationWeights,
+        strategy: SearchStrategy,
+        offset: int,
+        on_finished
+    ):
+        """Run a search, replaying cached results for a repeated query."""
+        key = self._search_key(filters, weights, strategy, offset)
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            routes, pool_size = cached
+            # Deliver asynchronously, like the worker would
+            QTimer.singleShot(0, lambda: on_finished(list(routes), pool_size))
+            return
+
+        self._worker_key = key
+        self._search_handler = on_finished
+        self._search_running = True
+        self._search_requested.emit(filters, weights, strategy, offset, 10)
+
+    def _on_worker_finished(self, routes: List[RouteRow], pool_size: int):
+        """Cache the worker's results and hand them to the pending handler."""
+        self._search_running = False
+        if self._worker_key is not None:
+            self._result_cache[self._worker_key] = (list(routes), pool_size)
+            self._result_cache.move_to_end(self._worker_key)
+            while len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+            self._worker_key = None
+
+        handler, self._search_handler = self._search_handler, None
+        if handler is not None:
+            handler(routes, pool_size)
+
+    def _on_worker_error(self, error: str):
+        """Clear the pending search and report the worker's error."""
+        self._search_running = False
+        self._worker_key = None
+        self._search_handler = None
+        self._on_route_error(error)
+
+    def shutdown(self):
+        """Stop the worker thread and release the service's process pool."""
+        self._worker_thread.requestInterruption()
+        self._worker_thread.quit()
+        if not self._worker_thread.wait(_SHUTDOWN_TIMEOUT_MS):
+            logger.warning("Route finder search still running at shutdown")
+        self.service.close()
+
+    def _on_more_routes_found(self, routes: List[RouteRow], pool_size: int):
         """Handle more routes loaded."""
         self.find_btn.setEnabled(True)
         self.more_btn.setEnabled(True)
@@ -829,175 +1185,197 @@ class RouteFinderTab(QWidget):
             self.status_label.setText("No more routes available")
             return
 
+        # Routes pushed out of the bounded list leave the tree too
+        overflow = len(self._current_routes) + len(routes) - _MAX_ROUTES
+        evicted = [self._current_routes[i] for i in range(max(0, overflow))]
+
         self._current_routes.extend(routes)
         self._route_offset += len(routes)
         self._last_pool_size = pool_size
+        self._total_missions += sum(len(c.missions) for _, _, c, _ in routes)
+        self._total_missions -= sum(len(c.missions) for _, _, c, _ in evicted)
 
         self.results_label.setText(f"Found {len(self._current_routes)} route(s)")
-        self._display_routes(self._current_routes)
+        self._append_routes(routes, evicted)
 
         # Hide "More" if we got less than a full batch
         if len(routes) < 10:
             self.more_btn.hide()
 
-        total_missions = sum(len(r.missions) for r in self._current_routes)
-        self.status_label.setText(f"Found {len(self._current_routes)} routes from {pool_size} missions (using {total_missions})")
+        self.status_label.setText(f"Found {len(self._current_routes)} routes from {pool_size} missions (using {self._total_missions})")
+
+    def _begin_tree_batch(self):
+        """Suspend repaints, signals, sorting and column fitting on the results tree."""
+        tree = self.results_tree
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
+        tree.setSortingEnabled(False)
+        header = tree.header()
+        for col in _FITTED_COLUMNS:
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.Interactive)
+
+    def _end_tree_batch(self):
+        """Fit columns once and restore what _begin_tree_batch suspended."""
+        tree = self.results_tree
+        header = tree.header()
+        for col in _FITTED_COLUMNS:
+            tree.resizeColumnToContents(col)
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+        tree.blockSignals(False)
+        tree.setUpdatesEnabled(True)
 
-    def _display_routes(self, routes: List[CandidateRoute], apply_default_sort: bool = False):
-        """Display routes in the results tree."""
-        self.results_tree.clear()
-        # Disable sorting while populating to avoid performance issues
-        self.results_tree.setSortingEnabled(False)
-
-        for i, candidate in enumerate(routes, 1):
-            metrics = candidate.metrics
-            route = candidate.route
-
-            # Create top-level item with sortable support
-            item = SortableTreeWidgetItem()
-            item.setText(0, f"Route #{i}")
-            item.setText(1, f"{metrics.total_reward:,.0f} aUEC")
-            item.setText(2, str(metrics.stop_count))
-            item.setText(3, str(metrics.total_scu))
-            item.setText(4, str(metrics.mission_count))
-            item.setText(5, f"{candidate.score:,.1f}")
+        # Re-enable sorting after populating
+        tree.setSortingEnabled(True)
+
+    def _build_route_items(self, routes: List[RouteRow], highlight_first: bool) -> List[QTreeWidgetItem]:
+        """Create top-level result items for prepared route rows."""
+        items = []
+        for texts, keys, candidate, details in routes:
+            # Create top-level item with sortable support (texts formatted by the worker)
+            item = SortableTreeWidgetItem(list(texts))
+            for col, key in zip(_FITTED_COLUMNS, keys):
+                item.setData(col, SORT_KEY_ROLE, key)
 
             # Store route data
             item.setData(0, Qt.ItemDataRole.UserRole, candidate)
+            item.setData(0, DETAILS_ROLE, details)
+            item.setData(0, POPULATED_ROLE, False)
 
-            # Add placeholder child (will be populated on expand)
-            placeholder = QTreeWidgetItem()
-            placeholder.setText(0, "Loading...")
-            item.addChild(placeholder)
+            # Show an expand arrow without creating children; they are built on expand
+            item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
 
-            # Color based on ranking
-            if i == 1:
-                for col in range(6):
-                    item.setBackground(col, QColor(76, 175, 80, 50))  # Green tint
+            items.append(item)
 
-            self.results_tree.addTopLevelItem(item)
+        # Color based on ranking
+        if highlight_first and items:
+            for col in range(6):
+                items[0].setBackground(col, _TOP_ROUTE_BRUSH)
 
-        # Re-enable sorting after populating
-        self.results_tree.setSortingEnabled(True)
+        return items
+
+    def _display_routes(self, routes: List[RouteRow], apply_default_sort: bool = False):
+        """Display routes in the results tree."""
+        # Populate in one batch: no repaints, signals, sorting or per-row column fitting
+        self._cancel_detail_batches()
+        self._begin_tree_batch()
+        self.results_tree.clear()
+        self.results_tree.addTopLevelItems(self._build_route_items(list(routes), highlight_first=True))
+        self._end_tree_batch()
 
         # Apply default sort based on dominant optimization goal
         if apply_default_sort and self._last_weights:
             goal = self._last_weights.get_dominant_goal()
-            # Map goals to columns and sort order
-            # Columns: 0=Route, 1=Reward, 2=Stops, 3=SCU, 4=Missions, 5=Score
-            sort_config = {
-                OptimizationGoal.MAX_REWARD: (1, Qt.SortOrder.DescendingOrder),
-                OptimizationGoal.FEWEST_STOPS: (2, Qt.SortOrder.AscendingOrder),
-                OptimizationGoal.MIN_DISTANCE: (5, Qt.SortOrder.DescendingOrder),
-                OptimizationGoal.BEST_REWARD_PER_STOP: (5, Qt.SortOrder.DescendingOrder),
-                OptimizationGoal.BEST_REWARD_PER_SCU: (5, Qt.SortOrder.DescendingOrder),
-            }
-            col, order = sort_config.get(goal, (5, Qt.SortOrder.DescendingOrder))
+            col, order = _GOAL_SORT.get(goal, (5, Qt.SortOrder.DescendingOrder))
             self.results_tree.sortByColumn(col, order)
 
+    def _append_routes(self, routes: List[RouteRow], evicted: List[RouteRow]):
+        """Add a batch of routes to the tree, dropping rows for evicted routes."""
+        tree = self.results_tree
+        self._begin_tree_batch()
+
+        if evicted:
+            evicted_ids = {id(c) for _, _, c, _ in evicted}
+            for index in reversed(range(tree.topLevelItemCount())):
+                candidate = tree.topLevelItem(index).data(0, Qt.ItemDataRole.UserRole)
+                if id(candidate) in evicted_ids:
+                    self._pending_details.pop(id(tree.topLevelItem(index)), None)
+                    tree.takeTopLevelItem(index)
+
+        tree.addTopLevelItems(self._build_route_items(routes, highlight_first=False))
+        self._end_tree_batch()
+
     def _on_item_expanded(self, item: QTreeWidgetItem):
         """Handle item expansion - populate details."""
-        # Check if already populated
-        if item.childCount() > 0:
-            first_child = item.child(0)
-            if first_child.text(0) != "Loading...":
-                return  # Already populated
-
-        # Get candidate data
-        candidate = item.data(0, Qt.ItemDataRole.UserRole)
-        if not candidate:
+        # Only route rows carry the flag; details are built while expanded
+        if item.data(0, POPULATED_ROLE) is not False:
             return
 
-        # Remove placeholder
-        item.takeChildren()
+        details = item.data(0, DETAILS_ROLE)
+        if not details:
+            return
 
-        # Collect all items to set spanning after adding to tree
-        items_to_span = []
-
-        # Add stops section
-        stops_item = QTreeWidgetItem(item)
-        stops_item.setText(0, "== STOPS ==")
-        items_to_span.append(stops_item)
-
-        for stop in candidate.route.stops:
-            stop_item = StopTreeWidgetItem(stops_item)
-            stop_item.setText(0, f"{stop.stop_number}. {stop.location}")
-            items_to_span.append(stop_item)
-
-            # Add pickup/delivery details
-            if stop.pickups:
-                for obj in stop.pickups:
-                    pickup_item = QTreeWidgetItem(stop_item)
-                    pickup_item.setText(0, f"    [+] LOAD: {obj.scu_amount} SCU {obj.cargo_type}")
-                    pickup_item.setForeground(0, QColor(76, 175, 80))  # Green
-                    items_to_span.append(pickup_item)
-
-            if stop.deliveries:
-                for obj in stop.deliveries:
-                    delivery_item = QTreeWidgetItem(stop_item)
-                    delivery_item.setText(0, f"    [-] DELIVER: {obj.scu_amount} SCU {obj.cargo_type}")
-                    delivery_item.setForeground(0, QColor(244, 67, 54))  # Red
-                    items_to_span.append(delivery_item)
-
-            # Cargo state
-            cargo_item = QTreeWidgetItem(stop_item)
-            cargo_item.setText(0, f"    Cargo: {stop.cargo_before} -> {stop.cargo_after} SCU")
-            cargo_item.setForeground(0, QColor(158, 158, 158))  # Gray
-            items_to_span.append(cargo_item)
-
-        stops_item.setExpanded(True)
-
-        # Add missions section
-        missions_item = QTreeWidgetItem(item)
-        missions_item.setText(0, f"== MISSIONS ({len(candidate.missions)}) ==")
-        items_to_span.append(missions_item)
-
-        for mission_scan in candidate.missions:
-            mission_data = mission_scan.get("mission_data", {})
-            reward = mission_data.get("reward", 0)
-            rank = mission_data.get("rank", "")
-
-            mission_item = QTreeWidgetItem(missions_item)
-            if rank:
-                mission_item.setText(0, f"[{rank}] {reward:,.0f} aUEC")
-            else:
-                mission_item.setText(0, f"{reward:,.0f} aUEC")
-            items_to_span.append(mission_item)
-
-            # Add objectives
-            for obj in mission_data.get("objectives", []):
-                obj_item = QTreeWidgetItem(mission_item)
-                obj_item.setText(
-                    0,
-                    f"    {obj.get('scu_amount', 0)} SCU: "
-                    f"{obj.get('collect_from', '?')} -> {obj.get('deliver_to', '?')}"
-                )
-                items_to_span.append(obj_item)
-
-        # Add metrics section
-        metrics_item = QTreeWidgetItem(item)
-        metrics_item.setText(0, "== METRICS ==")
-        items_to_span.append(metrics_item)
-
-        metrics = candidate.metrics
-        metrics_details = [
-            f"Total Reward: {metrics.total_reward:,.0f} aUEC",
-            f"Total SCU: {metrics.total_scu}",
-            f"Stops: {metrics.stop_count}",
-            f"Reward/Stop: {metrics.reward_per_stop:,.0f} aUEC",
-            f"Reward/SCU: {metrics.reward_per_scu:,.1f} aUEC",
-            f"Est. Distance: {metrics.estimated_distance:.1f}",
-        ]
+        # First batch now so the row opens with content; the rest is added
+        # a batch per event-loop tick to keep wide routes from blocking input
+        steps = self._populate_route_details(item, details)
+        if self._run_detail_batch(item.treeWidget(), steps):
+            self._pending_details[id(item)] = steps
+            self._details_timer.start()
+        elif not self._pending_details:
+            self._finish_detail_batches()
+
+    def _on_item_collapsed(self, item: QTreeWidgetItem):
+        """Release a collapsed route row's detail items."""
+        # Details are rebuilt from the pre-formatted rows on the next expand,
+        # so only expanded routes keep child items alive
+        if item.data(0, POPULATED_ROLE) is not True:
+            return
 
-        for detail in metrics_details:
-            detail_item = QTreeWidgetItem(metrics_item)
-            detail_item.setText(0, detail)
-            items_to_span.append(detail_item)
+        if self._pending_details.pop(id(item), None) is not None and not self._pending_details:
+            self._finish_detail_batches()
+        item.setData(0, POPULATED_ROLE, False)
+        item.takeChildren()
 
-        # Now set spanning on all items (must be done after items are in tree)
-        for span_item in items_to_span:
-            span_item.setFirstColumnSpanned(True)
+    def _populate_route_details(self, item: QTreeWidgetItem, details: Tuple[DetailRow, ...]) -> Iterator[None]:
+        """Add a route row's pre-formatted detail rows as children, yielding between batches."""
+        item.setData(0, POPULATED_ROLE, True)
+
+        # Text was formatted by the worker; only items are created here.
+        # Sorting is off until the last batch, so rows go straight into the tree in
+        # order and are spanned as they are created
+        parents = [item]
+        for index, row in enumerate(details, 1):
+            del parents[row.depth + 1:]
+            parents.append(_make_detail_item(parents[-1], row))
+            if index % _DETAIL_BATCH_SIZE == 0:
+                yield
+
+    def _populate_next_detail_batch(self):
+        """Add the next batch of detail rows for the oldest pending expansion."""
+        if not self._pending_details:
+            self._details_timer.stop()
+            return
+
+        key, steps = next(iter(self._pending_details.items()))
+        if not self._run_detail_batch(self.results_tree, steps):
+            self._pending_details.pop(key, None)
+            if not self._pending_details:
+                self._finish_detail_batches()
+
+    def _run_detail_batch(self, tree: QTreeWidget, steps: Iterator[None]) -> bool:
+        """Advance a detail population by one batch; return False once it is done."""
+        # No repaints or signals per row within a batch. Sorting stays off
+        # until _finish_detail_batches, so the tree re-sorts once per
+        # expansion run instead of once per batch
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
+        tree.setSortingEnabled(False)
+        try:
+            next(steps)
+            return True
+        except StopIteration:
+            return False
+        finally:
+            tree.blockSignals(False)
+            tree.setUpdatesEnabled(True)
+            tree.viewport().update()
+
+    def _finish_detail_batches(self):
+        """Stop the detail timer and re-enable the sorting suspended for it."""
+        self._details_timer.stop()
+        self._restore_sorting()
+
+    def _cancel_detail_batches(self):
+        """Drop unfinished expansions before the route rows they fill are removed."""
+        if self._pending_details:
+            self._pending_details.clear()
+            self._finish_detail_batches()
+
+    def _restore_sorting(self):
+        """Re-enable header sorting if a detail expansion left it off."""
+        # setSortingEnabled(True) always re-sorts, so skip it when already on
+        if not self.results_tree.isSortingEnabled():
+            self.results_tree.setSortingEnabled(True)
 
     def refresh(self):
-        """Refresh the tab data."""
-        self._load_initial_data()
+        """Refresh the tab data (debounced)."""
+        self._refresh_timer.start()
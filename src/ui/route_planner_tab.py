@@ -12,6 +12,9 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QColor, QBrush, QAction, QPainter
 
+from bisect import bisect_right
+from typing import Dict, List, Optional
+
 from src.config import Config
 from src.mission_manager import MissionManager
 from src.route_optimizer import RouteOptimizer
@@ -19,6 +22,13 @@ from src.logger import get_logger
 
 logger = get_logger()
 
+# Route tree columns sized to their contents (#, Status)
+_FITTED_COLUMNS = (0, 1)
+
+# Shared text brushes (Qt brushes are implicitly shared)
+_DONE_BRUSH = QBrush(QColor("#4caf50"))  # Green
+_LIGHT_TEXT_BRUSH = QBrush(QColor("#e0e0e0"))  # Light text
+
 
 class RouteOptimizerWorker(QThread):
     """Background worker for route optimization."""
@@ -79,9 +89,11 @@ class RouteOptimizerWorker(QThread):
                         )
                         mission_objects.append(mission_obj)
 
+                    # A superseded optimization is interrupted by the tab
                     solver = DynamicVRPSolver(
                         ship_capacity=self.ship_capacity,
-                        starting_location=None
+                        starting_location=None,
+                        should_stop=self.isInterruptionRequested
                     )
 
                     # Balanced = medium optimization (~500ms), Best = advanced (~3s)
@@ -123,20 +135,20 @@ class RouteOptimizerWorker(QThread):
 
 
 class ColoredItemDelegate(QStyledItemDelegate):
-    """Custom delegate to paint item backgrounds with custom colors."""
+    """
+    Custom delegate to paint item backgrounds with custom colors.
+
+    The ::item stylesheet rules stop the style from drawing BackgroundRole
+    (it ignores option.backgroundBrush too), so the fill has to happen here.
+    """
 
     def paint(self, painter, option, index):
         """Paint item with custom background color if set."""
-        # Get custom background color from item data
-        bg_color = index.data(Qt.ItemDataRole.BackgroundRole)
-
-        if bg_color and isinstance(bg_color, (QColor, QBrush)):
-            # Extract QColor from QBrush if needed
-            if isinstance(bg_color, QBrush):
-                bg_color = bg_color.color()
-
-            # Fill background with custom color
-            painter.fillRect(option.rect, bg_color)
+        # Runs for every visible cell on every repaint, so keep it to one
+        # lookup; fillRect takes the stored QColor or QBrush as is
+        bg = index.data(Qt.ItemDataRole.BackgroundRole)
+        if bg is not None:
+            painter.fillRect(option.rect, bg)
 
         # Call parent to paint the rest (text, etc.)
         super().paint(painter, option, index)
@@ -145,6 +157,31 @@ class ColoredItemDelegate(QStyledItemDelegate):
 class RoutePlannerTab(QWidget):
     """Route planning and cargo loading optimization tab with interactive tracking."""
 
+    # Palette of subtle, muted colors for dark theme (grey-ish but distinct)
+    _DESTINATION_PALETTE = (
+        QColor(70, 50, 50),     # Muted dark red
+        QColor(50, 55, 70),     # Muted dark blue
+        QColor(50, 65, 50),     # Muted dark green
+        QColor(70, 60, 50),     # Muted dark orange/brown
+        QColor(60, 50, 70),     # Muted dark purple
+        QColor(70, 50, 60),     # Muted dark pink
+        QColor(50, 65, 65),     # Muted dark cyan
+        QColor(65, 65, 50),     # Muted dark olive
+        QColor(60, 60, 60),     # Medium gray
+    )
+
+    # Palette of distinct colors for missions (brighter than destination colors)
+    _MISSION_PALETTE = (
+        QColor(60, 80, 60),     # Green tint
+        QColor(60, 60, 80),     # Blue tint
+        QColor(80, 70, 50),     # Orange/brown tint
+        QColor(70, 50, 70),     # Purple tint
+        QColor(50, 70, 70),     # Cyan tint
+        QColor(80, 60, 60),     # Red tint
+        QColor(70, 70, 50),     # Olive tint
+        QColor(60, 70, 80),     # Steel blue tint
+    )
+
     def __init__(self, config: Config, mission_manager: MissionManager):
         super().__init__()
 
@@ -167,6 +204,7 @@ class RoutePlannerTab(QWidget):
         self.current_route = None
         self._optimization_generation = 0  # Counter to ignore stale results
         self._active_workers = []  # Keep references to prevent garbage collection
+        self._stop_items: Dict[int, QTreeWidgetItem] = {}  # Stop number -> displayed stop row
 
         self._setup_ui()
 
@@ -270,13 +308,16 @@ class RoutePlannerTab(QWidget):
         missions = self.mission_manager.get_missions(status="active")
 
         if not missions:
-            self.route_tree.clear()
+            self._clear_route_tree()
             self.status_label.setText("No missions to plan")
             return
 
-        # Increment generation to ignore results from any previous workers
+        # Increment generation to ignore results from any previous workers,
+        # and ask them to wind down rather than finish their time budget
         self._optimization_generation += 1
         current_generation = self._optimization_generation
+        for old_worker in self._active_workers:
+            old_worker.requestInterruption()
 
         # Show optimizing status
         self.status_label.setText("Optimizing...")
@@ -459,7 +500,7 @@ class RoutePlannerTab(QWidget):
 
         if not fallback_status:
             # Complete failure, no fallback
-            self.route_tree.clear()
+            self._clear_route_tree()
             self.status_label.setText("Optimization failed")
             QMessageBox.critical(
                 self,
@@ -474,28 +515,42 @@ class RoutePlannerTab(QWidget):
                 f"Dynamic solver failed. Using VRP solver.\n\nError: {error_message}"
             )
 
-    def _find_delivery_stop_number(self, destination: str, current_stop: int) -> int:
+    def _build_delivery_index(self) -> Dict[str, List[int]]:
+        """
+        Map each location in the current route to the stop numbers visiting it.
+
+        Returns:
+            Dictionary of location name to ascending stop numbers
+        """
+        delivery_index: Dict[str, List[int]] = {}
+        if self.current_route:
+            for i, stop in enumerate(self.current_route.stops, 1):
+                delivery_index.setdefault(stop.location, []).append(i)
+        return delivery_index
+
+    def _find_delivery_stop_number(self, destination: str, current_stop: int,
+                                   delivery_index: Dict[str, List[int]]) -> int:
         """
         Find which stop number a destination will be visited for delivery.
 
         Args:
             destination: The delivery location name
             current_stop: Current stop number (to search after this)
+            delivery_index: Location to stop numbers map from _build_delivery_index
 
         Returns:
             Stop number where delivery occurs, or 0 if not found
         """
-        if not self.current_route:
+        # First visit to the destination after the current stop
+        stop_numbers = delivery_index.get(destination)
+        if not stop_numbers:
             return 0
 
-        # Search stops after current stop
-        for i, stop in enumerate(self.current_route.stops[current_stop:], current_stop + 1):
-            if stop.location == destination:
-                return i
-
-        return 0
+        pos = bisect_right(stop_numbers, current_stop)
+        return stop_numbers[pos] if pos < len(stop_numbers) else 0
 
-    def _sort_pickups_by_delivery_order(self, pickups, current_stop_num: int):
+    def _sort_pickups_by_delivery_order(self, pickups, current_stop_num: int,
+                                        delivery_index: Dict[str, List[int]]):
         """
         Sort pickups by their delivery order in the route using LIFO (Last In, First Out).
         Items delivered LAST are listed first (load deep in cargo hold).
@@ -504,15 +559,16 @@ class RoutePlannerTab(QWidget):
         Args:
             pickups: List of Objective pickups at this stop
             current_stop_num: Current stop number in route
+            delivery_index: Location to stop numbers map from _build_delivery_index
 
         Returns:
-            Sorted list of pickups in LIFO order (latest delivery first)
+            List of (pickup, delivery stop number) pairs in LIFO order (latest delivery first)
         """
         # Create list with delivery stop numbers
-        pickup_with_stops = []
-        for pickup in pickups:
-            delivery_stop = self._find_delivery_stop_number(pickup.deliver_to, current_stop_num)
-            pickup_with_stops.append((pickup, delivery_stop))
+        pickup_with_stops = [
+            (pickup, self._find_delivery_stop_number(pickup.deliver_to, current_stop_num, delivery_index))
+            for pickup in pickups
+        ]
 
         # Sort by: 1) delivery stop number DESCENDING (LIFO), 2) destination name, 3) SCU amount
         pickup_with_stops.sort(key=lambda x: (
@@ -521,7 +577,7 @@ class RoutePlannerTab(QWidget):
             -x[0].scu_amount  # Within same destination, larger items first
         ))
 
-        return [pickup for pickup, _ in pickup_with_stops]
+        return pickup_with_stops
 
     def _get_destination_color(self, destination: str, destination_colors: dict) -> QColor:
         """
@@ -534,24 +590,10 @@ class RoutePlannerTab(QWidget):
         Returns:
             QColor for the destination
         """
-        # Palette of subtle, muted colors for dark theme (grey-ish but distinct)
-        color_palette = [
-            QColor(70, 50, 50),     # Muted dark red
-            QColor(50, 55, 70),     # Muted dark blue
-            QColor(50, 65, 50),     # Muted dark green
-            QColor(70, 60, 50),     # Muted dark orange/brown
-            QColor(60, 50, 70),     # Muted dark purple
-            QColor(70, 50, 60),     # Muted dark pink
-            QColor(50, 65, 65),     # Muted dark cyan
-            QColor(65, 65, 50),     # Muted dark olive
-            QColor(60, 60, 60),     # Medium gray
-        ]
-
         # Assign color index to new destinations
-        if destination not in destination_colors:
-            destination_colors[destination] = len(destination_colors) % len(color_palette)
-
-        return color_palette[destination_colors[destination]]
+        palette = self._DESTINATION_PALETTE
+        index = destination_colors.setdefault(destination, len(destination_colors) % len(palette))
+        return palette[index]
 
     def _get_mission_color(self, mission_id: str, mission_colors: dict) -> QColor:
         """
@@ -564,27 +606,34 @@ class RoutePlannerTab(QWidget):
         Returns:
             QColor for the mission
         """
-        # Palette of distinct colors for missions (brighter than destination colors)
-        color_palette = [
-            QColor(60, 80, 60),     # Green tint
-            QColor(60, 60, 80),     # Blue tint
-            QColor(80, 70, 50),     # Orange/brown tint
-            QColor(70, 50, 70),     # Purple tint
-            QColor(50, 70, 70),     # Cyan tint
-            QColor(80, 60, 60),     # Red tint
-            QColor(70, 70, 50),     # Olive tint
-            QColor(60, 70, 80),     # Steel blue tint
-        ]
-
         # Assign color index to new missions
-        if mission_id not in mission_colors:
-            mission_colors[mission_id] = len(mission_colors) % len(color_palette)
-
-        return color_palette[mission_colors[mission_id]]
+        palette = self._MISSION_PALETTE
+        index = mission_colors.setdefault(mission_id, len(mission_colors) % len(palette))
+        return palette[index]
 
     def _update_route_display(self):
         """Update the route tree display."""
-        self.route_tree.clear()
+        # Rebuild as one batch: no repaints, item signals or per-row column fitting
+        tree = self.route_tree
+        header = tree.header()
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
+        for col in _FITTED_COLUMNS:
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.Interactive)
+        try:
+            self._populate_route_tree()
+            # Hold and stop rows all start expanded; one pass instead of one per row
+            tree.expandToDepth(0)
+        finally:
+            # Switching back to ResizeToContents fits each column once
+            for col in _FITTED_COLUMNS:
+                header.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+            tree.blockSignals(False)
+            tree.setUpdatesEnabled(True)
+
+    def _populate_route_tree(self):
+        """Rebuild the route tree rows and the status summary."""
+        self._clear_route_tree()
 
         # Get cargo in hold (picked up but not delivered)
         cargo_in_hold = self._get_cargo_in_hold()
@@ -592,22 +641,25 @@ class RoutePlannerTab(QWidget):
 
         # Show "In Cargo Hold" section if there's cargo
         if cargo_in_hold:
-            hold_item = QTreeWidgetItem(self.route_tree)
-            hold_item.setText(0, "")
-            hold_item.setText(1, "[HOLD]")
-            hold_item.setText(2, "Cargo Hold")
             hold_total_scu = sum(obj.get('scu_amount', 0) for obj in cargo_in_hold)
-            hold_item.setText(3, f"{len(cargo_in_hold)} items loaded")
             cargo_pct = (hold_total_scu / self.selected_ship_capacity * 100) if self.selected_ship_capacity > 0 else 0
-            hold_item.setText(4, f"{hold_total_scu} SCU ({cargo_pct:.0f}%)")
+            hold_item = QTreeWidgetItem(self.route_tree, [
+                "",
+                "[HOLD]",
+                "Cargo Hold",
+                f"{len(cargo_in_hold)} items loaded",
+                f"{hold_total_scu} SCU ({cargo_pct:.0f}%)"
+            ])
 
             # Style the hold section header
             for col in range(5):
-                hold_item.setForeground(col, QBrush(QColor("#4caf50")))  # Green
+                hold_item.setForeground(col, _DONE_BRUSH)
 
             # Add detail rows for cargo in hold, colored by mission
             mission_colors = {}  # Track colors per mission_id
             for obj in cargo_in_hold:
+                # Detail rows set only their own columns; empty texts in
+                # the leading columns would widen the fitted # column
                 detail_item = QTreeWidgetItem(hold_item)
                 detail_item.setText(2, f"  [OK] {obj.get('scu_amount', 0)} SCU {obj.get('cargo_type', 'Unknown')}")
                 detail_item.setText(3, f"-> Deliver to {obj.get('deliver_to', '?')}")
@@ -618,30 +670,15 @@ class RoutePlannerTab(QWidget):
                     bg_color = self._get_mission_color(mission_id, mission_colors)
                     for col in range(5):
                         detail_item.setData(col, Qt.ItemDataRole.BackgroundRole, bg_color)
-                        detail_item.setForeground(col, QBrush(QColor("#e0e0e0")))  # Light text
-
-            hold_item.setExpanded(True)  # Expanded by default to show cargo
+                        detail_item.setForeground(col, _LIGHT_TEXT_BRUSH)
 
         if not self.current_route:
             return
 
         total_reward = 0
+        delivery_index = self._build_delivery_index()
 
         for i, stop in enumerate(self.current_route.stops, 1):
-            # Create stop item
-            stop_item = QTreeWidgetItem(self.route_tree)
-            stop_item.setData(0, Qt.ItemDataRole.UserRole, i)  # Store stop number
-
-            # Stop number
-            stop_item.setText(0, str(i))
-
-            # Status - any stop in the route is pending (completed items are filtered out)
-            status = "[TODO] Pending"
-            stop_item.setText(1, status)
-
-            # Location
-            stop_item.setText(2, stop.location)
-
             # Actions summary
             actions = []
             if stop.pickups:
@@ -650,7 +687,6 @@ class RoutePlannerTab(QWidget):
             if stop.deliveries:
                 delivery_scu = sum(d.scu_amount for d in stop.deliveries)
                 actions.append(f"📤 DELIVER {delivery_scu} SCU")
-            stop_item.setText(3, " | ".join(actions))
 
             # Update cargo tracking
             for pickup in stop.pickups:
@@ -661,22 +697,28 @@ class RoutePlannerTab(QWidget):
 
             # Cargo load percentage
             cargo_pct = (current_cargo / self.selected_ship_capacity * 100) if self.selected_ship_capacity > 0 else 0
-            stop_item.setText(4, f"{current_cargo} SCU ({cargo_pct:.0f}%)")
+
+            # Create stop item - any stop in the route is pending (completed items are filtered out)
+            stop_item = QTreeWidgetItem(self.route_tree, [
+                str(i),
+                "[TODO] Pending",
+                stop.location,
+                " | ".join(actions),
+                f"{current_cargo} SCU ({cargo_pct:.0f}%)"
+            ])
+            stop_item.setData(0, Qt.ItemDataRole.UserRole, i)  # Store stop number
+            self._stop_items[i] = stop_item
 
             # Add detail rows for pickups - grouped by destination and sorted by delivery order
             if stop.pickups:
-                sorted_pickups = self._sort_pickups_by_delivery_order(stop.pickups, i)
+                sorted_pickups = self._sort_pickups_by_delivery_order(stop.pickups, i, delivery_index)
 
                 # Track destination colors for this stop
                 destination_colors = {}
 
-                for pickup in sorted_pickups:
-                    detail_item = QTreeWidgetItem(stop_item)
-
-                    # Find delivery stop number for this pickup
-                    delivery_stop_num = self._find_delivery_stop_number(pickup.deliver_to, i)
+                for pickup, delivery_stop_num in sorted_pickups:
                     stop_indicator = f" (Stop #{delivery_stop_num})" if delivery_stop_num else ""
-
+                    detail_item = QTreeWidgetItem(stop_item)
                     detail_item.setText(2, f"  [LOAD] Load: {pickup.scu_amount} SCU {pickup.cargo_type}")
                     detail_item.setText(3, f"-> Deliver to {pickup.deliver_to}{stop_indicator}")
 
@@ -711,9 +753,6 @@ class RoutePlannerTab(QWidget):
                     'scu_amount': delivery.scu_amount
                 })
 
-            # All stops in route are pending, keep expanded
-            stop_item.setExpanded(True)
-
         # Update status - show remaining stops and completed missions
         total = len(self.current_route.stops)
         cargo_in_hold = self._get_cargo_in_hold()
@@ -723,6 +762,22 @@ class RoutePlannerTab(QWidget):
             f"{total} stops remaining  |  {in_hold_count} items in hold  |  {completed_missions} missions done"
         )
 
+    def _clear_route_tree(self):
+        """Remove all rows from the route tree."""
+        self._stop_items = {}
+        self.route_tree.clear()
+
+    def _refresh_stop_item(self, stop_num: int):
+        """Show a stop as done right away, while the route is re-optimized."""
+        stop_item = self._stop_items.get(stop_num)
+        if stop_item is None:
+            return
+
+        stop_item.setText(1, "[OK] Done")
+        for col in range(5):
+            stop_item.setForeground(col, _DONE_BRUSH)
+        stop_item.setExpanded(False)
+
     def _toggle_stop_completion(self, item: QTreeWidgetItem, column: int):
         """Mark stop or individual cargo item as complete on double-click."""
         # Check if this is an individual cargo item (detail row)
@@ -742,6 +797,7 @@ class RoutePlannerTab(QWidget):
 
         # All stops in the route are pending, so double-click marks complete
         self._complete_stop_and_missions(stop_num)
+        self._refresh_stop_item(stop_num)
         # Re-optimize to move completed pickups to "In Cargo Hold"
         self.refresh()
 
@@ -816,13 +872,17 @@ class RoutePlannerTab(QWidget):
                 )
                 affected_missions.add(delivery.mission_id)
 
-        # Check if any affected missions are now fully complete
-        for mission_id in affected_missions:
-            self._check_mission_completion(mission_id)
+        # Check if any affected missions are now fully complete, resolving
+        # them with one pass over the missions rather than a lookup each
+        if affected_missions:
+            missions_by_id = {m["id"]: m for m in self.mission_manager.get_missions()}
+            for mission_id in affected_missions:
+                self._check_mission_completion(mission_id, missions_by_id.get(mission_id))
 
-    def _check_mission_completion(self, mission_id: str):
+    def _check_mission_completion(self, mission_id: str, mission: Optional[dict] = None):
         """Check if all objectives of a mission are complete and update status."""
-        mission = self.mission_manager.get_mission(mission_id)
+        if mission is None:
+            mission = self.mission_manager.get_mission(mission_id)
         if not mission:
             return
 
@@ -883,6 +943,7 @@ class RoutePlannerTab(QWidget):
     def _mark_complete(self, stop_num: int):
         """Mark stop as complete."""
         self._complete_stop_and_missions(stop_num)
+        self._refresh_stop_item(stop_num)
         # Re-optimize to move completed pickups to "In Cargo Hold"
         self.refresh()
 
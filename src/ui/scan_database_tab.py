@@ -31,6 +31,11 @@ logger = get_logger()
 # Color for unsynced scans (light blue)
 UNSYNCED_BG_COLOR = QColor(173, 216, 230, 80)  # Light blue with transparency
 
+# Shared cell brushes, built once instead of per row
+_UNSYNCED_BRUSH = QBrush(UNSYNCED_BG_COLOR)
+_MISSING_LOCATION_BRUSH = QBrush(QColor("#ff9800"))  # Orange
+_PLACEHOLDER_BRUSH = QBrush(QColor("#808080"))  # Gray
+
 
 class ScanDatabaseTab(QWidget):
     """Tab for viewing and managing the scan database."""
@@ -210,7 +215,7 @@ class ScanDatabaseTab(QWidget):
 
         # Check if scan is unsynced (for highlighting)
         is_unsynced = not scan.get("synced", False)
-        unsynced_brush = QBrush(UNSYNCED_BG_COLOR) if is_unsynced else None
+        unsynced_brush = _UNSYNCED_BRUSH if is_unsynced else None
 
         # Scan time
         scan_time = scan.get("scan_timestamp", "")
@@ -232,7 +237,7 @@ class ScanDatabaseTab(QWidget):
         if not locations:
             location_str = "(No Location)"
             loc_item = QTableWidgetItem(location_str)
-            loc_item.setForeground(QColor("#ff9800"))
+            loc_item.setForeground(_MISSING_LOCATION_BRUSH)
         elif len(locations) == 1:
             location_str = locations[0]
             loc_item = QTableWidgetItem(location_str)
@@ -251,7 +256,7 @@ class ScanDatabaseTab(QWidget):
         rank = mission_data.get("rank", "")
         rank_item = QTableWidgetItem(rank if rank else "-")
         if not rank:
-            rank_item.setForeground(QColor("#808080"))
+            rank_item.setForeground(_PLACEHOLDER_BRUSH)
         if unsynced_brush:
             rank_item.setBackground(unsynced_brush)
         self.table.setItem(row, 2, rank_item)
@@ -260,7 +265,7 @@ class ScanDatabaseTab(QWidget):
         contracted_by = mission_data.get("contracted_by", "")
         contracted_item = QTableWidgetItem(contracted_by if contracted_by else "-")
         if not contracted_by:
-            contracted_item.setForeground(QColor("#808080"))
+            contracted_item.setForeground(_PLACEHOLDER_BRUSH)
         if unsynced_brush:
             contracted_item.setBackground(unsynced_brush)
         self.table.setItem(row, 3, contracted_item)
@@ -473,7 +478,7 @@ class ScanDatabaseTab(QWidget):
             return
 
         # Get available locations
-        locations = SPECIAL_LOCATIONS + self.location_matcher.get_scannable_locations()
+        locations = [*SPECIAL_LOCATIONS, *self.location_matcher.get_scannable_locations()]
 
         # Create dialog with line edit and autocomplete
         dialog = QDialog(self)
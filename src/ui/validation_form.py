@@ -115,8 +115,8 @@ class ObjectiveRow(QWidget):
 
     def _setup_location_autocomplete(self, line_edit: QLineEdit):
         """Setup location autocomplete for a line edit."""
-        locations = self.location_matcher.get_all_locations()
-        completer = QCompleter(locations)
+        # Every objective row shares the matcher's model instead of copying the list
+        completer = QCompleter(self.location_matcher.completion_model, line_edit)
         completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         completer.setFilterMode(Qt.MatchFlag.MatchContains)
         line_edit.setCompleter(completer)